@@ -1,14 +1,23 @@
 """Alembic environment configuration for backend migrations."""
 
 import asyncio
+import sys
 from logging.config import fileConfig
+from pathlib import Path
 
 from alembic import context
 from sqlalchemy import pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
-from src.config import get_settings
-from src.users.models import Base
+
+# Import app modules under the same names the application uses, so an
+# in-process upgrade reuses them instead of loading a src.* duplicate
+SRC_DIR = str(Path(__file__).resolve().parent.parent / "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from config import get_settings  # noqa: E402
+from users.models import Base  # noqa: E402
 
 config = context.config
 
@@ -60,7 +69,16 @@ async def run_async_migrations() -> None:
 
 
 def run_migrations_online() -> None:
-    """Run migrations in 'online' mode."""
+    """Run migrations in 'online' mode.
+
+    Reuses a connection passed in via ``config.attributes`` (the
+    application's startup runner does this) instead of opening a new one.
+    """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
     asyncio.run(run_async_migrations())
 
 
@@ -16,6 +16,17 @@ down_revision: Union[str, None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# (name, table, columns, unique) - built after every table exists
+INDEXES: tuple[tuple[str, str, str, bool], ...] = (
+    ("ix_permissions_name", "permissions", "name", True),
+    ("ix_permissions_codename", "permissions", "codename", True),
+    ("ix_groups_name", "groups", "name", True),
+    ("ix_users_email", "users", "email", True),
+    ("ix_users_phone", "users", "phone", True),
+    ("ix_users_username", "users", "username", True),
+    ("ix_otps_purpose", "otps", "purpose", False),
+)
+
 
 def upgrade() -> None:
     """Upgrade database schema."""
@@ -28,18 +39,6 @@ def upgrade() -> None:
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(
-        op.f("ix_permissions_id"), "permissions", ["id"], unique=False
-    )
-    op.create_index(
-        op.f("ix_permissions_name"), "permissions", ["name"], unique=True
-    )
-    op.create_index(
-        op.f("ix_permissions_codename"),
-        "permissions",
-        ["codename"],
-        unique=True,
-    )
 
     op.create_table(
         "groups",
@@ -49,8 +48,6 @@ def upgrade() -> None:
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(op.f("ix_groups_id"), "groups", ["id"], unique=False)
-    op.create_index(op.f("ix_groups_name"), "groups", ["name"], unique=True)
 
     op.create_table(
         "users",
@@ -77,12 +74,6 @@ def upgrade() -> None:
         sa.Column("last_login", sa.DateTime(timezone=True), nullable=True),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(op.f("ix_users_id"), "users", ["id"], unique=False)
-    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
-    op.create_index(op.f("ix_users_phone"), "users", ["phone"], unique=True)
-    op.create_index(
-        op.f("ix_users_username"), "users", ["username"], unique=True
-    )
 
     op.create_table(
         "profiles",
@@ -99,7 +90,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("user_id"),
     )
-    op.create_index(op.f("ix_profiles_id"), "profiles", ["id"], unique=False)
 
     op.create_table(
         "otps",
@@ -120,8 +110,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(op.f("ix_otps_id"), "otps", ["id"], unique=False)
-    op.create_index(op.f("ix_otps_purpose"), "otps", ["purpose"], unique=False)
 
     op.create_table(
         "group_permissions",
@@ -145,25 +133,24 @@ def upgrade() -> None:
         ),
     )
 
+    with op.get_context().autocommit_block():
+        for name, table, columns, unique in INDEXES:
+            kind = "UNIQUE INDEX" if unique else "INDEX"
+            op.execute(
+                f"CREATE {kind} CONCURRENTLY {name} ON {table} ({columns})"
+            )
+
 
 def downgrade() -> None:
     """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        for name, _, _, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
     op.drop_table("user_groups")
     op.drop_table("group_permissions")
-    op.drop_index(op.f("ix_otps_purpose"), table_name="otps")
-    op.drop_index(op.f("ix_otps_id"), table_name="otps")
     op.drop_table("otps")
-    op.drop_index(op.f("ix_profiles_id"), table_name="profiles")
     op.drop_table("profiles")
-    op.drop_index(op.f("ix_users_username"), table_name="users")
-    op.drop_index(op.f("ix_users_phone"), table_name="users")
-    op.drop_index(op.f("ix_users_email"), table_name="users")
-    op.drop_index(op.f("ix_users_id"), table_name="users")
     op.drop_table("users")
-    op.drop_index(op.f("ix_groups_name"), table_name="groups")
-    op.drop_index(op.f("ix_groups_id"), table_name="groups")
     op.drop_table("groups")
-    op.drop_index(op.f("ix_permissions_codename"), table_name="permissions")
-    op.drop_index(op.f("ix_permissions_name"), table_name="permissions")
-    op.drop_index(op.f("ix_permissions_id"), table_name="permissions")
     op.drop_table("permissions")
@@ -0,0 +1,32 @@
+"""Index otps.user_id for user-scoped OTP lookups.
+
+Revision ID: 002_otp_user_id_index
+Revises: 001_initial_users
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "002_otp_user_id_index"
+down_revision: Union[str, None] = "001_initial_users"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Serves OTP invalidation by user and the ON DELETE CASCADE from users
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_otps_user_id "
+            "ON otps (user_id)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_otps_user_id")
@@ -0,0 +1,42 @@
+"""Index active OTP lookups by phone and purpose.
+
+Revision ID: 003_otp_phone_purpose_index
+Revises: 002_otp_user_id_index
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "003_otp_phone_purpose_index"
+down_revision: Union[str, None] = "002_otp_user_id_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Partial index matching the phone-based active OTP lookup; it
+    # replaces the low-selectivity index on purpose alone
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            "ix_otps_phone_purpose_active "
+            "ON otps (phone, purpose, expires_at DESC) "
+            "WHERE is_used = false"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_otps_purpose")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_otps_purpose "
+            "ON otps (purpose)"
+        )
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_otps_phone_purpose_active"
+        )
@@ -0,0 +1,55 @@
+"""Allow at most one active OTP per email and purpose.
+
+Revision ID: 004_otp_active_email_unique
+Revises: 003_otp_phone_purpose_index
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "004_otp_active_email_unique"
+down_revision: Union[str, None] = "003_otp_phone_purpose_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Existing duplicates would fail the unique build; only the newest
+    # active OTP per (email, purpose) stays usable
+    op.execute(
+        """
+        UPDATE otps SET is_used = true
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY email, purpose
+                    ORDER BY created_at DESC, id DESC
+                ) AS row_num
+                FROM otps
+                WHERE is_used = false AND email IS NOT NULL
+            ) ranked
+            WHERE row_num > 1
+        )
+        """
+    )
+
+    # Backs the ON CONFLICT upserts in the OTP service and the active
+    # OTP lookup in verify_otp
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "
+            "uq_otps_active_email_purpose "
+            "ON otps (email, purpose) WHERE is_used = false"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS uq_otps_active_email_purpose"
+        )
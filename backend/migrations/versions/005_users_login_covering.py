@@ -0,0 +1,49 @@
+"""Cover the login lookup with the user email and phone indexes.
+
+Revision ID: 005_users_login_covering
+Revises: 004_otp_active_email_unique
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "005_users_login_covering"
+down_revision: Union[str, None] = "004_otp_active_email_unique"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Covered by the login lookup so it can be answered by an index-only scan
+LOGIN_COLUMNS = "id, hashed_password, is_active, is_verified"
+
+# (new name, old name, column) - the covering index replaces the plain one
+LOGIN_INDEXES: tuple[tuple[str, str, str], ...] = (
+    ("ix_users_email_login", "ix_users_email", "email"),
+    ("ix_users_phone_login", "ix_users_phone", "phone"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Built before the old index is dropped, so uniqueness is enforced
+    # throughout
+    with op.get_context().autocommit_block():
+        for name, old_name, column in LOGIN_INDEXES:
+            op.execute(
+                f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON users ({column}) INCLUDE ({LOGIN_COLUMNS})"
+            )
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {old_name}")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        for name, old_name, column in reversed(LOGIN_INDEXES):
+            op.execute(
+                f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {old_name} "
+                f"ON users ({column})"
+            )
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,32 @@
+"""Index otps.expires_at for pruning expired OTPs.
+
+Revision ID: 006_otp_expires_at_index
+Revises: 005_users_login_covering
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "006_otp_expires_at_index"
+down_revision: Union[str, None] = "005_users_login_covering"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Range scans for the batched delete of expired OTPs
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_otps_expires_at "
+            "ON otps (expires_at)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_otps_expires_at")
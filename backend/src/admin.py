@@ -1,9 +1,20 @@
+import time
+from collections.abc import Callable
+from typing import Any
+
 from auth.services.admin_auth_service import AdminAuthBackend
 from config import get_settings
 from database import get_db_manager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from sqladmin import Admin, ModelView
-from sqladmin.filters import ForeignKeyFilter, OperationColumnFilter
+from sqladmin.filters import (
+    ForeignKeyFilter,
+    OperationColumnFilter,
+    get_column_obj,
+    get_foreign_column_name,
+)
+from sqlalchemy import Select, select
+from sqlalchemy.orm import configure_mappers, defer, undefer
 from starlette.middleware.sessions import SessionMiddleware
 from users.admin import (
     GroupAdmin,
@@ -28,6 +39,70 @@ from rag_module.db.models import (
 )
 
 
+class CachedForeignKeyFilter(ForeignKeyFilter):
+    """ForeignKeyFilter with a bounded, briefly cached dropdown query."""
+
+    def __init__(
+        self,
+        *args: Any,
+        limit: int = 500,
+        ttl_seconds: float = 60.0,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize cached foreign key filter.
+
+        Args:
+            *args: Positional arguments for ForeignKeyFilter
+            limit: Maximum number of dropdown options
+            ttl_seconds: How long fetched options are reused
+            **kwargs: Keyword arguments for ForeignKeyFilter
+        """
+        super().__init__(*args, **kwargs)
+        self.limit = limit
+        self.ttl_seconds = ttl_seconds
+        self._options: list[tuple[str, str]] = []
+        self._expires_at = 0.0
+
+    async def lookups(
+        self,
+        request: Request,
+        model: Any,
+        run_query: Callable[[Select], Any],
+    ) -> list[tuple[str, str]]:
+        """Return dropdown options, newest keys first.
+
+        Args:
+            request: Incoming admin request
+            model: Model of the admin view
+            run_query: Callable executing a select statement
+
+        Returns:
+            List of (value, label) pairs including the "All" option
+        """
+        if time.monotonic() < self._expires_at:
+            return self._options
+
+        foreign_key_obj = get_column_obj(self.foreign_key, model)
+        key_obj = getattr(
+            self.foreign_model, get_foreign_column_name(foreign_key_obj)
+        )
+        display_obj = get_column_obj(
+            self.foreign_display_field, self.foreign_model
+        )
+
+        rows = await run_query(
+            select(key_obj, display_obj)
+            .distinct()
+            .order_by(key_obj.desc())
+            .limit(self.limit)
+        )
+        self._options = [("", "All")] + [
+            (str(key), str(value)) for key, value in rows
+        ]
+        self._expires_at = time.monotonic() + self.ttl_seconds
+        return self._options
+
+
 class SourceAdmin(ModelView, model=Source):
     """Admin view for Source model."""
 
@@ -58,16 +133,36 @@ class ArticleAdmin(ModelView, model=Article):
         "importance",
         "is_breaking",
         "is_high_importance",
+        "content_preview",
         "created_at",
         "updated_at",
     ]
+    column_details_exclude_list = ["content_preview"]
+    form_excluded_columns = ["content_preview"]
     column_filters = [
-        ForeignKeyFilter("source_id", "name", Source),
+        CachedForeignKeyFilter("source_id", "name", Source),
         OperationColumnFilter("date"),
         OperationColumnFilter("category"),
         OperationColumnFilter("sentiment"),
     ]
 
+    def list_query(self, request: Request) -> Select:
+        """Load the list page without the article text columns.
+
+        Args:
+            request: Incoming admin request
+
+        Returns:
+            Article select with long text deferred and the preview loaded
+        """
+        return select(Article).options(
+            defer(Article.short_preview),
+            defer(Article.full_content),
+            defer(Article.summary),
+            defer(Article.reasoning),
+            undefer(Article.content_preview),
+        )
+
 
 class ChunkAdmin(ModelView, model=Chunk):
     """Admin view for Chunk model."""
@@ -84,7 +179,7 @@ class ChunkAdmin(ModelView, model=Chunk):
         "created_at",
     ]
     column_filters = [
-        ForeignKeyFilter("article_id", "id", Article),
+        CachedForeignKeyFilter("article_id", "id", Article),
         OperationColumnFilter("chunk_index"),
     ]
 
@@ -136,8 +231,8 @@ class ArticleSubcategoryAdmin(ModelView, model=ArticleSubcategory):
     icon = "fa-solid fa-link"
     column_list = ["id", "article_id", "subcategory_id"]
     column_filters = [
-        ForeignKeyFilter("article_id", "id", Article),
-        ForeignKeyFilter("subcategory_id", "name", Subcategory),
+        CachedForeignKeyFilter("article_id", "id", Article),
+        CachedForeignKeyFilter("subcategory_id", "name", Subcategory),
     ]
 
 
@@ -148,8 +243,8 @@ class ArticleTopicAdmin(ModelView, model=ArticleTopic):
     icon = "fa-solid fa-link"
     column_list = ["id", "article_id", "topic_id"]
     column_filters = [
-        ForeignKeyFilter("article_id", "id", Article),
-        ForeignKeyFilter("topic_id", "name", Topic),
+        CachedForeignKeyFilter("article_id", "id", Article),
+        CachedForeignKeyFilter("topic_id", "name", Topic),
     ]
 
 
@@ -160,8 +255,8 @@ class ArticleKeywordAdmin(ModelView, model=ArticleKeyword):
     icon = "fa-solid fa-link"
     column_list = ["id", "article_id", "keyword_id"]
     column_filters = [
-        ForeignKeyFilter("article_id", "id", Article),
-        ForeignKeyFilter("keyword_id", "value", Keyword),
+        CachedForeignKeyFilter("article_id", "id", Article),
+        CachedForeignKeyFilter("keyword_id", "value", Keyword),
     ]
 
 
@@ -172,16 +267,41 @@ class ArticleEntityAdmin(ModelView, model=ArticleEntity):
     icon = "fa-solid fa-link"
     column_list = ["id", "article_id", "entity_id"]
     column_filters = [
-        ForeignKeyFilter("article_id", "id", Article),
-        ForeignKeyFilter("entity_id", "text", Entity),
+        CachedForeignKeyFilter("article_id", "id", Article),
+        CachedForeignKeyFilter("entity_id", "text", Entity),
     ]
 
 
+ADMIN_VIEWS: tuple[type[ModelView], ...] = (
+    # User management views
+    UserAdmin,
+    GroupAdmin,
+    PermissionAdmin,
+    ProfileAdmin,
+    OTPAdmin,
+    # News views
+    SourceAdmin,
+    ArticleAdmin,
+    ChunkAdmin,
+    SubcategoryAdmin,
+    TopicAdmin,
+    KeywordAdmin,
+    EntityAdmin,
+    ArticleSubcategoryAdmin,
+    ArticleTopicAdmin,
+    ArticleKeywordAdmin,
+    ArticleEntityAdmin,
+)
+
+
 def setup_admin(app: FastAPI) -> None:
     """Configure SQLAdmin with superuser authentication."""
     settings = get_settings()
     db_manager = get_db_manager()
 
+    # Resolve every mapper once up front; views only read ORM metadata
+    configure_mappers()
+
     app.add_middleware(SessionMiddleware, secret_key=settings.jwt_secret_key)
 
     authentication_backend = AdminAuthBackend(
@@ -191,22 +311,5 @@ def setup_admin(app: FastAPI) -> None:
         app, db_manager.engine, authentication_backend=authentication_backend
     )
 
-    # User management views
-    admin.add_view(UserAdmin)
-    admin.add_view(GroupAdmin)
-    admin.add_view(PermissionAdmin)
-    admin.add_view(ProfileAdmin)
-    admin.add_view(OTPAdmin)
-
-    # News views
-    admin.add_view(SourceAdmin)
-    admin.add_view(ArticleAdmin)
-    admin.add_view(ChunkAdmin)
-    admin.add_view(SubcategoryAdmin)
-    admin.add_view(TopicAdmin)
-    admin.add_view(KeywordAdmin)
-    admin.add_view(EntityAdmin)
-    admin.add_view(ArticleSubcategoryAdmin)
-    admin.add_view(ArticleTopicAdmin)
-    admin.add_view(ArticleKeywordAdmin)
-    admin.add_view(ArticleEntityAdmin)
+    for view in ADMIN_VIEWS:
+        admin.add_view(view)
@@ -1,6 +1,6 @@
 """Authentication routes for login, registration, and password management."""
 
-from typing import Annotated
+from typing import Annotated, Any
 
 from auth.schemas import (
     ChangePasswordOTPRequest,
@@ -16,7 +16,8 @@ from auth.schemas import (
 )
 from auth.services.auth_service import AuthService
 from auth.services.otp_service import OTPService
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Response, status
+from fastapi.responses import ORJSONResponse
 from users.dependencies import (
     get_auth_service,
     get_current_active_user,
@@ -25,71 +26,114 @@ from users.dependencies import (
 from users.models import User
 from users.schemas import UserResponse
 
-router = APIRouter(prefix="/auth", tags=["authentication"])
+router = APIRouter(
+    prefix="/auth",
+    tags=["authentication"],
+    default_response_class=ORJSONResponse,
+)
+
+_OTP_RESPONSE_DOCS: dict[int | str, dict[str, Any]] = {
+    200: {"model": OTPResponse}
+}
+
+
+def _render_otp_response(message: str) -> bytes:
+    """Serialize a constant OTP confirmation body once at import time.
+
+    Args:
+        message: Confirmation message
+
+    Returns:
+        JSON-encoded OTPResponse body
+    """
+    return (
+        OTPResponse(message=message, expires_in_minutes=10)
+        .model_dump_json()
+        .encode()
+    )
 
 
-@router.post("/register/send-otp", response_model=OTPResponse)
+_OTP_SENT_BODY = _render_otp_response("Verification code sent to your email")
+_OTP_RESENT_BODY = _render_otp_response(
+    "Verification code resent to your email"
+)
+_RESET_OTP_SENT_BODY = _render_otp_response(
+    "Password reset code sent to your email"
+)
+_RESET_OTP_RESENT_BODY = _render_otp_response(
+    "Password reset code resent to your email"
+)
+
+
+def _otp_response(body: bytes) -> Response:
+    """Wrap a pre-serialized OTP confirmation body in a response.
+
+    Args:
+        body: Pre-serialized JSON body
+
+    Returns:
+        JSON response skipping model validation and encoding
+    """
+    return Response(content=body, media_type="application/json")
+
+
+@router.post("/register/send-otp", responses=_OTP_RESPONSE_DOCS)
 async def send_registration_otp(
     email_data: OTPSendRequest,
+    background_tasks: BackgroundTasks,
     otp_service: Annotated[OTPService, Depends(get_otp_service)],
-) -> OTPResponse:
+) -> Response:
     """Send OTP for registration.
 
     Args:
         email_data: Email for OTP
+        background_tasks: Tasks run after the response is sent
         otp_service: OTP service
 
     Returns:
         OTP sent confirmation
-
-    Raises:
-        HTTPException: If email already exists
     """
-    if not email_data.email:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email is required for registration",
-        )
-
-    await otp_service.send_otp_email(
-        email=email_data.email, purpose="registration"
+    otp = await otp_service.create_otp(
+        purpose="registration", email=email_data.email
     )
-
-    return OTPResponse(
-        message="Verification code sent to your email",
-        expires_in_minutes=10,
+    background_tasks.add_task(
+        otp_service.dispatch_otp_email,
+        email_data.email,
+        otp.code,
+        "registration",
     )
 
+    return _otp_response(_OTP_SENT_BODY)
 
-@router.post("/register/resend-otp", response_model=OTPResponse)
+
+@router.post("/register/resend-otp", responses=_OTP_RESPONSE_DOCS)
 async def resend_registration_otp(
     email_data: OTPSendRequest,
+    background_tasks: BackgroundTasks,
     otp_service: Annotated[OTPService, Depends(get_otp_service)],
-) -> OTPResponse:
+) -> Response:
     """Resend OTP for registration.
 
     Args:
         email_data: Email for OTP
+        background_tasks: Tasks run after the response is sent
         otp_service: OTP service
 
     Returns:
         OTP sent confirmation
     """
-    if not email_data.email:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email is required",
-        )
-
-    await otp_service.send_otp_email(
-        email=email_data.email, purpose="registration"
+    otp = await otp_service.get_or_create_otp(
+        purpose="registration", email=email_data.email
     )
-
-    return OTPResponse(
-        message="Verification code resent to your email",
-        expires_in_minutes=10,
+    background_tasks.add_task(
+        otp_service.dispatch_otp_email,
+        email_data.email,
+        otp.code,
+        "registration",
     )
 
+    return _otp_response(_OTP_RESENT_BODY)
+
 
 @router.post(
     "/register/verify",
@@ -98,13 +142,17 @@ async def resend_registration_otp(
 )
 async def verify_registration(
     verify_data: RegisterVerifyRequest,
+    background_tasks: BackgroundTasks,
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
+    otp_service: Annotated[OTPService, Depends(get_otp_service)],
 ) -> UserResponse:
     """Complete registration with OTP verification.
 
     Args:
         verify_data: Registration verification data
+        background_tasks: Tasks run after the response is sent
         auth_service: Authentication service
+        otp_service: OTP service
 
     Returns:
         Created user data
@@ -120,6 +168,8 @@ async def verify_registration(
         full_name=verify_data.full_name,
     )
 
+    background_tasks.add_task(otp_service.send_welcome_email, result["user"])
+
     return UserResponse.model_validate(result["user"])
 
 
@@ -144,7 +194,8 @@ async def login(
         login_data.login, login_data.password
     )
 
-    return TokenResponse(
+    # Tokens are minted by AuthService, so validation would be redundant
+    return TokenResponse.model_construct(
         access_token=result["access_token"],
         refresh_token=result["refresh_token"],
     )
@@ -171,7 +222,8 @@ async def refresh_token(
         refresh_data.refresh_token
     )
 
-    return TokenResponse(
+    # Tokens are minted by AuthService, so validation would be redundant
+    return TokenResponse.model_construct(
         access_token=result["access_token"],
         refresh_token=result["refresh_token"],
     )
@@ -195,65 +247,63 @@ async def verify_token(
     return TokenVerifyResponse(**result)
 
 
-@router.post("/reset-password/send-otp", response_model=OTPResponse)
+@router.post("/reset-password/send-otp", responses=_OTP_RESPONSE_DOCS)
 async def send_password_reset_otp(
     email_data: OTPSendRequest,
+    background_tasks: BackgroundTasks,
     otp_service: Annotated[OTPService, Depends(get_otp_service)],
-) -> OTPResponse:
+) -> Response:
     """Send OTP for password reset.
 
     Args:
         email_data: Email for password reset
+        background_tasks: Tasks run after the response is sent
         otp_service: OTP service
 
     Returns:
         OTP sent confirmation
     """
-    if not email_data.email:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email is required",
-        )
-
-    await otp_service.send_otp_email(
-        email=email_data.email, purpose="password_reset"
+    otp = await otp_service.create_otp(
+        purpose="password_reset", email=email_data.email
     )
-
-    return OTPResponse(
-        message="Password reset code sent to your email",
-        expires_in_minutes=10,
+    background_tasks.add_task(
+        otp_service.dispatch_otp_email,
+        email_data.email,
+        otp.code,
+        "password_reset",
     )
 
+    return _otp_response(_RESET_OTP_SENT_BODY)
+
 
-@router.post("/reset-password/resend-otp", response_model=OTPResponse)
+@router.post("/reset-password/resend-otp", responses=_OTP_RESPONSE_DOCS)
 async def resend_password_reset_otp(
     email_data: OTPSendRequest,
+    background_tasks: BackgroundTasks,
     otp_service: Annotated[OTPService, Depends(get_otp_service)],
-) -> OTPResponse:
+) -> Response:
     """Resend OTP for password reset.
 
     Args:
         email_data: Email for password reset
+        background_tasks: Tasks run after the response is sent
         otp_service: OTP service
 
     Returns:
         OTP sent confirmation
     """
-    if not email_data.email:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email is required",
-        )
-
-    await otp_service.send_otp_email(
-        email=email_data.email, purpose="password_reset"
+    otp = await otp_service.get_or_create_otp(
+        purpose="password_reset", email=email_data.email
     )
-
-    return OTPResponse(
-        message="Password reset code resent to your email",
-        expires_in_minutes=10,
+    background_tasks.add_task(
+        otp_service.dispatch_otp_email,
+        email_data.email,
+        otp.code,
+        "password_reset",
     )
 
+    return _otp_response(_RESET_OTP_RESENT_BODY)
+
 
 @router.post("/reset-password/verify")
 async def verify_password_reset(
@@ -297,31 +347,36 @@ async def change_password(
     )
 
 
-@router.post("/change-password/send-otp", response_model=OTPResponse)
+@router.post("/change-password/send-otp", responses=_OTP_RESPONSE_DOCS)
 async def send_change_password_otp(
     current_user: Annotated[User, Depends(get_current_active_user)],
+    background_tasks: BackgroundTasks,
     otp_service: Annotated[OTPService, Depends(get_otp_service)],
-) -> OTPResponse:
+) -> Response:
     """Send OTP for password change.
 
     Args:
         current_user: Current authenticated user
+        background_tasks: Tasks run after the response is sent
         otp_service: OTP service
 
     Returns:
         OTP sent confirmation
     """
-    await otp_service.send_otp_email(
-        email=current_user.email,
+    otp = await otp_service.create_otp(
         purpose="change_password",
+        email=current_user.email,
         user_id=current_user.id,
     )
-
-    return OTPResponse(
-        message="Verification code sent to your email",
-        expires_in_minutes=10,
+    background_tasks.add_task(
+        otp_service.dispatch_otp_email,
+        current_user.email,
+        otp.code,
+        "change_password",
     )
 
+    return _otp_response(_OTP_SENT_BODY)
+
 
 @router.post("/change-password/verify-otp")
 async def verify_change_password_otp(
@@ -1,67 +1,95 @@
 """Authentication-specific schemas."""
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from typing import Annotated
 
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    StringConstraints,
+)
 
-class LoginRequest(BaseModel):
-    """Login request schema."""
+
+def _lower_domain(email: str) -> str:
+    """Lowercase the domain part only, as EmailStr normalization does.
+
+    Args:
+        email: Email address that passed the pattern check
+
+    Returns:
+        Email with a lowercase domain
+    """
+    local, _, domain = email.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+# Lightweight email check for the OTP request schemas: the pattern runs in
+# pydantic-core instead of a full email-validator parse. Normalization
+# matches EmailStr so addresses compare equal across both types.
+FastEmailStr = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        max_length=254,
+        pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$",
+    ),
+    AfterValidator(_lower_domain),
+]
+
+
+class _AuthBase(BaseModel):
+    """Base class sharing the model config of all auth schemas."""
 
     model_config = ConfigDict(from_attributes=True)
 
+
+class LoginRequest(_AuthBase):
+    """Login request schema."""
+
     login: str = Field(..., description="Email or phone number")
     password: str = Field(..., min_length=8, description="User password")
 
 
-class TokenResponse(BaseModel):
+class TokenResponse(_AuthBase):
     """Token response schema."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     access_token: str
     refresh_token: str
     token_type: str = "bearer"
 
 
-class RefreshTokenRequest(BaseModel):
+class RefreshTokenRequest(_AuthBase):
     """Refresh token request schema."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     refresh_token: str
 
 
-class TokenVerifyResponse(BaseModel):
+class TokenVerifyResponse(_AuthBase):
     """Token verification response."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     valid: bool
     user_id: int | None = None
     email: str | None = None
 
 
-class OTPSendRequest(BaseModel):
+class OTPSendRequest(_AuthBase):
     """OTP send request schema."""
 
-    model_config = ConfigDict(from_attributes=True)
-
-    email: EmailStr = Field(..., description="Email for OTP delivery")
+    email: FastEmailStr = Field(..., description="Email for OTP delivery")
 
 
-class OTPResponse(BaseModel):
+class OTPResponse(_AuthBase):
     """OTP response schema."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     message: str
     expires_in_minutes: int = 10
 
 
-class RegisterVerifyRequest(BaseModel):
+class RegisterVerifyRequest(_AuthBase):
     """Registration verification request."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     email: EmailStr
     phone: str = Field(..., min_length=10, max_length=20)
     password: str = Field(..., min_length=8)
@@ -69,29 +97,23 @@ class RegisterVerifyRequest(BaseModel):
     full_name: str | None = Field(None, max_length=255)
 
 
-class PasswordResetRequest(BaseModel):
+class PasswordResetRequest(_AuthBase):
     """Password reset request schema."""
 
-    model_config = ConfigDict(from_attributes=True)
-
-    email: EmailStr
+    email: FastEmailStr
     code: str = Field(..., min_length=6, max_length=6)
     new_password: str = Field(..., min_length=8)
 
 
-class ChangePasswordRequest(BaseModel):
+class ChangePasswordRequest(_AuthBase):
     """Password change request with old password."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     old_password: str = Field(..., min_length=8)
     new_password: str = Field(..., min_length=8)
 
 
-class ChangePasswordOTPRequest(BaseModel):
+class ChangePasswordOTPRequest(_AuthBase):
     """Password change request with OTP."""
 
-    model_config = ConfigDict(from_attributes=True)
-
     code: str = Field(..., min_length=6, max_length=6)
     new_password: str = Field(..., min_length=8)
@@ -1,7 +1,20 @@
-from .admin_auth_service import AdminAuthBackend
-from .auth_service import AuthService
-from .email_service import SMTPEmailSender
-from .otp_service import OTPService
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .admin_auth_service import AdminAuthBackend
+    from .auth_service import AuthService
+    from .email_service import SMTPEmailSender
+    from .otp_service import OTPService
+
+# Re-exports are resolved on first access, so importing one service
+# module does not load the others (and sqladmin with the admin backend)
+_EXPORTS = {
+    "AuthService": ".auth_service",
+    "OTPService": ".otp_service",
+    "SMTPEmailSender": ".email_service",
+    "AdminAuthBackend": ".admin_auth_service",
+}
 
 __all__ = [
     "AuthService",
@@ -9,3 +22,22 @@ __all__ = [
     "SMTPEmailSender",
     "AdminAuthBackend",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported service class on first access.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        Requested service class
+
+    Raises:
+        AttributeError: If the name is not exported
+    """
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
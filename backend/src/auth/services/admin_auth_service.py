@@ -1,10 +1,22 @@
 """SQLAdmin authentication backend for superuser-only access."""
 
+import time
+
+from database import get_db_manager
 from fastapi import Request
 from sqladmin.authentication import AuthenticationBackend
 from sqlalchemy import select
-from src.database import get_db_manager
 from users.models import User
+from users.security import DUMMY_PASSWORD_HASH, PasswordHasher
+
+# How long a superuser check stored in the signed session is trusted.
+# Kept short: the flags are re-read from the database once it runs out,
+# so a deactivated or demoted admin loses access within this window on
+# every worker, whatever path changed the row.
+ADMIN_CLAIM_TTL_SECONDS = 30
+ADMIN_CLAIM_KEY = "admin_verified_until"
+
+_password_hasher = PasswordHasher()
 
 
 class AdminAuthBackend(AuthenticationBackend):
@@ -40,18 +52,24 @@ class AdminAuthBackend(AuthenticationBackend):
             )
             user = result.scalar_one_or_none()
 
+            # Hash even for unknown or non-admin users so timing does not
+            # reveal which usernames are valid superusers. Admin logins are
+            # rare, so the result cache would save nothing here
+            password_valid = _password_hasher.verify_password(
+                password,
+                user.hashed_password if user else DUMMY_PASSWORD_HASH,
+            )
+
             if not user or not user.is_superuser or not user.is_active:
                 return False
 
-            from users.security import PasswordHasher
-
-            password_hasher = PasswordHasher()
-            if not password_hasher.verify_password(
-                password, user.hashed_password
-            ):
+            if not password_valid:
                 return False
 
             request.session["user_id"] = user.id
+            request.session[ADMIN_CLAIM_KEY] = (
+                time.time() + ADMIN_CLAIM_TTL_SECONDS
+            )
             return True
 
     async def logout(self, request: Request) -> bool:
@@ -69,6 +87,10 @@ class AdminAuthBackend(AuthenticationBackend):
     async def authenticate(self, request: Request) -> bool:
         """Verify user has valid superuser session.
 
+        The superuser check is stored in the signed session and trusted
+        for ``ADMIN_CLAIM_TTL_SECONDS``, so most admin requests do not
+        touch the database. Once it expires the flags are re-checked.
+
         Args:
             request: HTTP request with session
 
@@ -76,20 +98,32 @@ class AdminAuthBackend(AuthenticationBackend):
             True if user is authenticated superuser, False otherwise
         """
         user_id = request.session.get("user_id")
-        if not user_id:
+        if not isinstance(user_id, int):
+            # Tampered or stale session payloads are rejected up front
+            # rather than failing inside the database query
+            request.session.clear()
             return False
 
-        try:
-            async for session in get_db_manager().get_session():
-                result = await session.execute(
-                    select(User).where(User.id == int(user_id))
+        verified_until = request.session.get(ADMIN_CLAIM_KEY, 0)
+        if verified_until > time.time():
+            return True
+
+        async for session in get_db_manager().get_session():
+            # Only the two flags are needed; skips loading the profile
+            result = await session.execute(
+                select(User.is_superuser, User.is_active).where(
+                    User.id == user_id
                 )
-                user = result.scalar_one_or_none()
+            )
+            user = result.one_or_none()
 
-                if not user or not user.is_superuser or not user.is_active:
-                    return False
+            if not user or not user.is_superuser or not user.is_active:
+                request.session.clear()
+                return False
 
-                return True
+            request.session[ADMIN_CLAIM_KEY] = (
+                time.time() + ADMIN_CLAIM_TTL_SECONDS
+            )
+            return True
 
-        except Exception:
-            return False
+        return False
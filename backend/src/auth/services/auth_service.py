@@ -7,7 +7,7 @@ from jose import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 from users.repository import GroupRepository, ProfileRepository, UserRepository
 from users.schemas import UserCreate
-from users.security import JWTHandler, PasswordHasher
+from users.security import DUMMY_PASSWORD_HASH, JWTHandler, PasswordHasher
 
 from .otp_service import OTPService
 
@@ -50,22 +50,20 @@ class AuthService:
         Raises:
             HTTPException: If email or username already exists
         """
-        existing_email = await self.user_repo.get_by_email(user_data.email)
-        if existing_email:
+        conflicts = await self.user_repo.get_conflicts(
+            user_data.email, username=user_data.username
+        )
+        if "email" in conflicts:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered",
             )
 
-        if user_data.username:
-            existing_username = await self.user_repo.get_by_username(
-                user_data.username
+        if "username" in conflicts:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Username already taken",
             )
-            if existing_username:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Username already taken",
-                )
 
         hashed_password = self.password_hasher.hash_password(
             user_data.password
@@ -79,8 +77,6 @@ class AuthService:
             full_name=user_data.full_name,
         )
 
-        user = await self.user_repo.get_by_id(user.id)
-
         tokens = self._generate_tokens(user.id)
 
         return {"user": user, **tokens}
@@ -95,39 +91,47 @@ class AuthService:
             password: Plain text password
 
         Returns:
-            User data with access and refresh tokens
+            User ID with access and refresh tokens
 
         Raises:
             HTTPException: If credentials are invalid or user is inactive
         """
-        user = await self.user_repo.get_by_login(login)
+        credentials = await self.user_repo.get_login_credentials(login)
+
+        # Always pay for a full hash check so response time does not
+        # reveal whether the login exists; the dummy check is never cached
+        if credentials is None:
+            self.password_hasher.verify_password(password, DUMMY_PASSWORD_HASH)
+            password_valid = False
+        else:
+            password_valid = self.password_hasher.verify_password_cached(
+                password, credentials.hashed_password
+            )
 
-        if user is None or not self.password_hasher.verify_password(
-            password, user.hashed_password
-        ):
+        if credentials is None or not password_valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email/phone or password",
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        if not user.is_active:
+        if not credentials.is_active:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="User account is inactive",
             )
 
-        if not user.is_verified:
+        if not credentials.is_verified:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Please verify your account first",
             )
 
-        await self.user_repo.update_last_login(user.id)
+        await self.user_repo.update_last_login(credentials.id)
 
-        tokens = self._generate_tokens(user.id)
+        tokens = self._generate_tokens(credentials.id)
 
-        return {"user": user, **tokens}
+        return {"user_id": credentials.id, **tokens}
 
     async def refresh_access_token(self, refresh_token: str) -> dict[str, str]:
         """Generate new access token from refresh token.
@@ -227,11 +231,9 @@ class AuthService:
         Returns:
             Dictionary with access_token and refresh_token
         """
-        access_token = self.jwt_handler.create_access_token(
-            data={"sub": user_id}
-        )
-        refresh_token = self.jwt_handler.create_refresh_token(
-            data={"sub": user_id}
+        # python-jose requires the sub claim to be a string
+        access_token, refresh_token = self.jwt_handler.create_token_pair(
+            {"sub": str(user_id)}
         )
 
         return {
@@ -265,20 +267,18 @@ class AuthService:
 
         await self.otp_service.verify_otp(code, "registration", email=email)
 
-        existing_email = await self.user_repo.get_by_email(email)
-        if existing_email:
+        conflicts = await self.user_repo.get_conflicts(email, phone=phone)
+        if "email" in conflicts:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered",
             )
 
-        if phone:
-            existing_phone = await self.user_repo.get_by_phone(phone)
-            if existing_phone:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Phone already registered",
-                )
+        if "phone" in conflicts:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Phone already registered",
+            )
 
         hashed_password = self.password_hasher.hash_password(password)
 
@@ -293,9 +293,8 @@ class AuthService:
 
         await self.profile_repo.create(user_id=user.id)
 
-        if self.otp_service:
-            await self.otp_service.send_welcome_email(user)
-
+        # The welcome email is left to the caller so it can be sent after
+        # the response instead of holding up registration
         tokens = self._generate_tokens(user.id)
         return {"user": user, **tokens}
 
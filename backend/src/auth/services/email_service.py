@@ -1,9 +1,29 @@
 """Email notification service with SOLID principles."""
 
+import asyncio
 import smtplib
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from email.charset import QP, Charset
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from functools import lru_cache
+
+# Placeholder for the OTP code in templated emails
+OTP_CODE_PLACEHOLDER = "__CODE__"
+
+# Quoted-printable keeps ASCII placeholders intact in serialized messages,
+# where the default base64 body encoding would scramble them
+_QP_UTF8 = Charset("utf-8")
+_QP_UTF8.body_encoding = QP
+_TO_PLACEHOLDER = "__TO__"
+MESSAGE_TEMPLATE_CACHE_SIZE = 64
+# SMTP sends run on their own threads, at most this many at once, each
+# with its own connection; bursts queue here instead of tying up the
+# default executor that other to_thread offloads rely on
+SMTP_POOL_SIZE = 4
 
 
 class IEmailSender(ABC):
@@ -16,6 +36,33 @@ class IEmailSender(ABC):
         """Send email to recipient."""
         pass
 
+    async def send_templated_email(
+        self,
+        to_email: str,
+        subject: str,
+        body: str,
+        values: dict[str, str],
+        html: bool = True,
+    ) -> bool:
+        """Send an email whose body contains placeholders.
+
+        Implementations may cache the rendered template; the default
+        fills in the placeholders and sends a regular email.
+
+        Args:
+            to_email: Recipient email address
+            subject: Email subject
+            body: Email body with placeholders
+            values: Placeholder to value mapping
+            html: Whether body is HTML format
+
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        for placeholder, value in values.items():
+            body = body.replace(placeholder, value)
+        return await self.send_email(to_email, subject, body, html)
+
 
 class SMTPEmailSender(IEmailSender):
     """SMTP email sender implementation."""
@@ -45,6 +92,16 @@ class SMTPEmailSender(IEmailSender):
         self.smtp_password = smtp_password
         self.from_email = from_email
         self.from_name = from_name
+        # Idle connections; never more than SMTP_POOL_SIZE exist since
+        # that bounds the threads using them
+        self._idle: list[smtplib.SMTP] = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=SMTP_POOL_SIZE, thread_name_prefix="smtp"
+        )
+        # Serialized messages by (subject, body, html); None marks
+        # templates whose placeholders did not survive encoding
+        self._message_templates: dict[tuple[str, str, bool], bytes | None] = {}
 
     async def send_email(
         self, to_email: str, subject: str, body: str, html: bool = True
@@ -61,66 +118,298 @@ class SMTPEmailSender(IEmailSender):
             True if sent successfully, False otherwise
         """
         try:
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = subject
-            msg["From"] = f"{self.from_name} <{self.from_email}>"
-            msg["To"] = to_email
+            await self._run(self._send_sync, to_email, subject, body, html)
+            return True
+        except Exception:
+            return False
 
-            if html:
-                msg.attach(MIMEText(body, "html"))
-            else:
-                msg.attach(MIMEText(body, "plain"))
+    async def send_templated_email(
+        self,
+        to_email: str,
+        subject: str,
+        body: str,
+        values: dict[str, str],
+        html: bool = True,
+    ) -> bool:
+        """Send a templated email from a cached serialized message.
 
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_user, self.smtp_password)
-                server.send_message(msg)
+        Args:
+            to_email: Recipient email address
+            subject: Email subject
+            body: Email body with placeholders
+            values: Placeholder to value mapping
+            html: Whether body is HTML format
 
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        try:
+            await self._run(
+                self._send_templated_sync,
+                to_email,
+                subject,
+                body,
+                values,
+                html,
+            )
             return True
         except Exception:
             return False
 
+    async def _run(self, func: Callable[..., None], *args: object) -> None:
+        """Run a blocking send on the dedicated SMTP executor.
 
-class EmailTemplateService:
-    """Service for generating email templates."""
+        Args:
+            func: Blocking send function
+            *args: Arguments for func
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, func, *args)
 
-    @staticmethod
-    def get_otp_template(
-        code: str, purpose: str, expires_minutes: int = 10
-    ) -> str:
-        """Generate OTP email template.
+    def _send_sync(
+        self, to_email: str, subject: str, body: str, html: bool
+    ) -> None:
+        """Build and send a message; runs in a worker thread.
+
+        MIME encoding of the body happens here too, so none of the
+        blocking work runs on the event loop.
 
         Args:
-            code: OTP code
-            purpose: Purpose of OTP (registration, password reset, etc.)
-            expires_minutes: OTP expiration time in minutes
+            to_email: Recipient email address
+            subject: Email subject
+            body: Email body content
+            html: Whether body is HTML format
+        """
+        msg = self._build_message(to_email, subject, body, html)
+        self._send_raw(to_email, msg.as_bytes())
+
+    def _send_templated_sync(
+        self,
+        to_email: str,
+        subject: str,
+        body: str,
+        values: dict[str, str],
+        html: bool,
+    ) -> None:
+        """Fill a cached message template and send it.
+
+        Only plain ASCII values without line breaks or ``=``, and a
+        recipient that is a bare address, are substituted as bytes;
+        anything else takes the regular path.
+
+        Args:
+            to_email: Recipient email address
+            subject: Email subject
+            body: Email body with placeholders
+            values: Placeholder to value mapping
+            html: Whether body is HTML format
+        """
+        raw = self._get_message_template(subject, body, values, html)
+
+        if (
+            raw is None
+            or not _is_plain_address(to_email)
+            or not all(_is_byte_safe(value) for value in values.values())
+        ):
+            for placeholder, value in values.items():
+                body = body.replace(placeholder, value)
+            self._send_sync(to_email, subject, body, html)
+            return
+
+        replacements = {_TO_PLACEHOLDER: to_email, **values}
+        for placeholder, value in replacements.items():
+            raw = raw.replace(placeholder.encode(), value.encode())
+        self._send_raw(to_email, raw)
+
+    def _get_message_template(
+        self, subject: str, body: str, values: dict[str, str], html: bool
+    ) -> bytes | None:
+        """Return the serialized message for a template, building it once.
+
+        Args:
+            subject: Email subject
+            body: Email body with placeholders
+            values: Placeholder to value mapping
+            html: Whether body is HTML format
 
         Returns:
-            HTML email template
+            Serialized message, or None if placeholders cannot be
+            substituted in it
+        """
+        key = (subject, body, html)
+        if key in self._message_templates:
+            return self._message_templates[key]
+
+        raw: bytes | None = self._build_message(
+            _TO_PLACEHOLDER, subject, body, html, charset=_QP_UTF8
+        ).as_bytes()
+        if any(
+            raw.count(placeholder.encode()) != body.count(placeholder)
+            for placeholder in values
+        ):
+            raw = None
+
+        if len(self._message_templates) >= MESSAGE_TEMPLATE_CACHE_SIZE:
+            self._message_templates.clear()
+        self._message_templates[key] = raw
+        return raw
+
+    def _build_message(
+        self,
+        to_email: str,
+        subject: str,
+        body: str,
+        html: bool,
+        charset: Charset | None = None,
+    ) -> MIMEMultipart:
+        """Build a MIME message.
+
+        Args:
+            to_email: Recipient email address
+            subject: Email subject
+            body: Email body content
+            html: Whether body is HTML format
+            charset: Body charset; detected from the body if omitted
+
+        Returns:
+            MIME message ready to send
         """
-        purpose_text = {
-            "registration": "verify your account",
-            "password_reset": "reset your password",
-            "change_password": "change your password",
-        }.get(purpose, "verify your action")
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = subject
+        msg["From"] = f"{self.from_name} <{self.from_email}>"
+        msg["To"] = to_email
+        msg.attach(MIMEText(body, "html" if html else "plain", charset))
+        return msg
 
-        return f"""
+    def _connect(self) -> smtplib.SMTP:
+        """Open an authenticated SMTP connection.
+
+        Returns:
+            Connected SMTP client
+        """
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30)
+        server.starttls()
+        server.login(self.smtp_user, self.smtp_password)
+        return server
+
+    def _send_raw(self, to_email: str, raw: bytes) -> None:
+        """Send a serialized message over a pooled connection.
+
+        Runs on an SMTP executor thread. A dropped connection is replaced
+        by a fresh one and the message resent once. Errors reported by
+        the server are raised without a resend, since the message may
+        already have been accepted for some recipients.
+
+        Args:
+            to_email: Recipient email address
+            raw: Serialized message
+        """
+        for attempt in range(2):
+            server = self._acquire_connection(fresh=attempt > 0)
+            try:
+                server.sendmail(self.from_email, [to_email], raw)
+            except smtplib.SMTPException as e:
+                server.close()
+                if attempt or not isinstance(
+                    e, smtplib.SMTPServerDisconnected
+                ):
+                    raise
+            except OSError:
+                # Connection reset or timed out; retry fresh
+                server.close()
+                if attempt:
+                    raise
+            else:
+                self._release_connection(server)
+                return
+
+    def _acquire_connection(self, fresh: bool = False) -> smtplib.SMTP:
+        """Take an idle connection, or open one if none is idle.
+
+        Args:
+            fresh: Open a new connection even if one is idle
+
+        Returns:
+            Connected SMTP client owned by the caller
+        """
+        if not fresh:
+            with self._lock:
+                if self._idle:
+                    return self._idle.pop()
+        return self._connect()
+
+    def _release_connection(self, server: smtplib.SMTP) -> None:
+        """Return a healthy connection to the idle pool.
+
+        Args:
+            server: Connection that finished a send
+        """
+        with self._lock:
+            if len(self._idle) < SMTP_POOL_SIZE:
+                self._idle.append(server)
+                return
+        server.close()
+
+
+def _is_byte_safe(value: str) -> bool:
+    """Check that a value can be substituted into a serialized message.
+
+    Args:
+        value: Placeholder value
+
+    Returns:
+        True if the value is ASCII without line breaks or ``=``
+    """
+    return value.isascii() and not any(c in value for c in "\r\n=")
+
+
+def _is_plain_address(value: str) -> bool:
+    """Check that a recipient can be spliced into the ``To:`` header.
+
+    The header is not re-encoded, so anything that could read as a
+    display name, a group or a second address is rejected.
+
+    Args:
+        value: Recipient email address
+
+    Returns:
+        True if the value is a bare, byte-safe addr-spec
+    """
+    return _is_byte_safe(value) and not any(c in value for c in ' \t,;<>"()')
+
+
+OTP_PURPOSE_TEXT = {
+    "registration": "verify your account",
+    "password_reset": "reset your password",
+    "change_password": "change your password",
+}
+
+OTP_SUBJECTS = {
+    "registration": "Verify Your Account",
+    "password_reset": "Reset Your Password",
+    "change_password": "Verify Password Change",
+}
+
+# Static <head> blocks are kept apart so only the short <body> is formatted
+_OTP_HEAD = """
 <!DOCTYPE html>
 <html>
 <head>
     <style>
-        body {{ font-family: Arial, sans-serif; background-color: #f4f4f4; margin: 0; padding: 0; }}
-        .container {{ max-width: 600px; margin: 40px auto; background: white; padding: 40px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        .header {{ text-align: center; margin-bottom: 30px; }}
-        .header h1 {{ color: #333; margin: 0; }}
-        .otp-code {{ background: #f0f0f0; border: 2px solid #4CAF50; border-radius: 8px; padding: 20px; text-align: center; margin: 30px 0; }}
-        .otp-code h2 {{ color: #4CAF50; font-size: 36px; margin: 0; letter-spacing: 8px; }}
-        .message {{ color: #666; line-height: 1.6; text-align: center; }}
-        .warning {{ color: #ff6b6b; font-size: 14px; margin-top: 20px; }}
-        .footer {{ text-align: center; margin-top: 40px; padding-top: 20px; border-top: 1px solid #eee; color: #999; font-size: 12px; }}
+        body { font-family: Arial, sans-serif; background-color: #f4f4f4; margin: 0; padding: 0; }
+        .container { max-width: 600px; margin: 40px auto; background: white; padding: 40px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        .header { text-align: center; margin-bottom: 30px; }
+        .header h1 { color: #333; margin: 0; }
+        .otp-code { background: #f0f0f0; border: 2px solid #4CAF50; border-radius: 8px; padding: 20px; text-align: center; margin: 30px 0; }
+        .otp-code h2 { color: #4CAF50; font-size: 36px; margin: 0; letter-spacing: 8px; }
+        .message { color: #666; line-height: 1.6; text-align: center; }
+        .warning { color: #ff6b6b; font-size: 14px; margin-top: 20px; }
+        .footer { text-align: center; margin-top: 40px; padding-top: 20px; border-top: 1px solid #eee; color: #999; font-size: 12px; }
     </style>
 </head>
-<body>
+"""
+
+_OTP_BODY = """<body>
     <div class="container">
         <div class="header">
             <h1>SearchNewsRAG</h1>
@@ -151,30 +440,22 @@ class EmailTemplateService:
 </html>
 """
 
-    @staticmethod
-    def get_welcome_template(username: str) -> str:
-        """Generate welcome email template.
-
-        Args:
-            username: User's name
-
-        Returns:
-            HTML email template
-        """
-        return f"""
+_WELCOME_HEAD = """
 <!DOCTYPE html>
 <html>
 <head>
     <style>
-        body {{ font-family: Arial, sans-serif; background-color: #f4f4f4; margin: 0; padding: 0; }}
-        .container {{ max-width: 600px; margin: 40px auto; background: white; padding: 40px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        .header {{ text-align: center; margin-bottom: 30px; }}
-        .header h1 {{ color: #4CAF50; margin: 0; }}
-        .message {{ color: #666; line-height: 1.6; }}
-        .footer {{ text-align: center; margin-top: 40px; padding-top: 20px; border-top: 1px solid #eee; color: #999; font-size: 12px; }}
+        body { font-family: Arial, sans-serif; background-color: #f4f4f4; margin: 0; padding: 0; }
+        .container { max-width: 600px; margin: 40px auto; background: white; padding: 40px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        .header { text-align: center; margin-bottom: 30px; }
+        .header h1 { color: #4CAF50; margin: 0; }
+        .message { color: #666; line-height: 1.6; }
+        .footer { text-align: center; margin-top: 40px; padding-top: 20px; border-top: 1px solid #eee; color: #999; font-size: 12px; }
     </style>
 </head>
-<body>
+"""
+
+_WELCOME_BODY = """<body>
     <div class="container">
         <div class="header">
             <h1>Welcome to SearchNewsRAG!</h1>
@@ -195,3 +476,47 @@ class EmailTemplateService:
 </body>
 </html>
 """
+
+
+class EmailTemplateService:
+    """Service for generating email templates."""
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def get_otp_template(
+        code: str, purpose: str, expires_minutes: int = 10
+    ) -> str:
+        """Generate OTP email template.
+
+        Renders are cached; callers pass ``OTP_CODE_PLACEHOLDER`` as the
+        code, so each purpose is rendered once.
+
+        Args:
+            code: OTP code
+            purpose: Purpose of OTP (registration, password reset, etc.)
+            expires_minutes: OTP expiration time in minutes
+
+        Returns:
+            HTML email template
+        """
+        purpose_text = OTP_PURPOSE_TEXT.get(purpose, "verify your action")
+
+        return _OTP_HEAD + _OTP_BODY.format_map(
+            {
+                "code": code,
+                "purpose_text": purpose_text,
+                "expires_minutes": expires_minutes,
+            }
+        )
+
+    @staticmethod
+    def get_welcome_template(username: str) -> str:
+        """Generate welcome email template.
+
+        Args:
+            username: User's name
+
+        Returns:
+            HTML email template
+        """
+        return _WELCOME_HEAD + _WELCOME_BODY.format_map({"username": username})
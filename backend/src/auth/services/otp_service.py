@@ -1,15 +1,23 @@
 """OTP (One-Time Password) service for verification."""
 
+import logging
 import secrets
-import string
 from datetime import datetime, timedelta, timezone
 
-from auth.services.email_service import EmailTemplateService, IEmailSender
+from auth.services.email_service import (
+    OTP_CODE_PLACEHOLDER,
+    OTP_SUBJECTS,
+    EmailTemplateService,
+    IEmailSender,
+)
 from fastapi import HTTPException, status
-from sqlalchemy import and_, select
+from sqlalchemy import and_, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from users.models import OTP, User
 
+logger = logging.getLogger(__name__)
+
 
 class OTPService:
     """Service for managing OTP operations."""
@@ -44,9 +52,8 @@ class OTPService:
         Returns:
             Random numeric OTP code
         """
-        return "".join(
-            secrets.choice(string.digits) for _ in range(self.otp_length)
-        )
+        # One CSPRNG draw, zero-padded to the configured length
+        return f"{secrets.randbelow(10**self.otp_length):0{self.otp_length}d}"
 
     async def create_otp(
         self,
@@ -79,7 +86,7 @@ class OTPService:
             minutes=self.otp_expire_minutes
         )
 
-        otp = OTP(
+        stmt = insert(OTP).values(
             user_id=user_id,
             email=email,
             phone=phone,
@@ -87,64 +94,129 @@ class OTPService:
             purpose=purpose,
             expires_at=expires_at,
         )
-
-        self.session.add(otp)
+        # A concurrent send may have inserted the active OTP for this
+        # (email, purpose) after our invalidation ran; rotate that row
+        # instead of tripping the partial unique index. RETURNING saves
+        # the refresh round-trip.
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[OTP.email, OTP.purpose],
+            index_where=OTP.is_used == False,  # noqa: E712
+            set_={
+                "code": stmt.excluded.code,
+                "expires_at": stmt.excluded.expires_at,
+                "attempts": 0,
+                "user_id": stmt.excluded.user_id,
+            },
+        )
+        result = await self.session.scalars(stmt.returning(OTP))
+        otp = result.one()
         await self.session.commit()
-        await self.session.refresh(otp)
 
         return otp
 
-    async def send_otp_email(
-        self, email: str, purpose: str, user_id: int | None = None
-    ) -> bool:
-        """Generate and send OTP via email.
+    async def get_or_create_otp(self, purpose: str, email: str) -> OTP:
+        """Return the active OTP for an email, creating one if needed.
+
+        Relies on the partial unique index on (email, purpose) for unused
+        OTPs, so repeated resends reuse the live code instead of writing
+        a new row each time.
 
         Args:
-            email: Recipient email address
             purpose: Purpose of OTP
-            user_id: Associated user ID
+            email: Email address for OTP
 
         Returns:
-            True if sent successfully
-
-        Raises:
-            HTTPException: If email sending fails
+            Active OTP instance
         """
-        otp = await self.create_otp(
-            purpose=purpose, email=email, user_id=user_id
+        now = datetime.now(timezone.utc)
+        stmt = (
+            insert(OTP)
+            .values(
+                email=email,
+                code=self._generate_code(),
+                purpose=purpose,
+                expires_at=now + timedelta(minutes=self.otp_expire_minutes),
+            )
+            .on_conflict_do_nothing(
+                index_elements=[OTP.email, OTP.purpose],
+                index_where=OTP.is_used == False,  # noqa: E712
+            )
+            .returning(OTP)
+        )
+        otp = (await self.session.scalars(stmt)).one_or_none()
+        await self.session.commit()
+
+        if otp is not None:
+            return otp
+
+        result = await self.session.execute(
+            select(OTP).where(
+                OTP.email == email,
+                OTP.purpose == purpose,
+                OTP.is_used == False,  # noqa: E712
+            )
         )
+        otp = result.scalar_one_or_none()
+
+        if otp is None or otp.expires_at <= now:
+            return await self.create_otp(purpose=purpose, email=email)
+
+        return otp
+
+    async def dispatch_otp_email(
+        self, email: str, code: str, purpose: str
+    ) -> None:
+        """Send an already created OTP code via email.
+
+        Meant to run as a background task after the response is sent, so
+        failures are logged instead of raised.
+
+        Args:
+            email: Recipient email address
+            code: OTP code to deliver
+            purpose: Purpose of OTP
+        """
+        if not await self._send_code(email, code, purpose):
+            logger.error(
+                "Failed to send %s verification email to %s", purpose, email
+            )
+
+    async def _send_code(self, email: str, code: str, purpose: str) -> bool:
+        """Render the OTP template and send it.
+
+        Args:
+            email: Recipient email address
+            code: OTP code to deliver
+            purpose: Purpose of OTP
 
-        subject = {
-            "registration": "Verify Your Account",
-            "password_reset": "Reset Your Password",
-            "change_password": "Verify Password Change",
-        }.get(purpose, "Verification Code")
+        Returns:
+            True if sent successfully, False otherwise
+        """
+        subject = OTP_SUBJECTS.get(purpose, "Verification Code")
 
+        # The code is filled in by the sender, which can then reuse one
+        # serialized message per purpose
         html_body = self.template_service.get_otp_template(
-            code=otp.code,
+            code=OTP_CODE_PLACEHOLDER,
             purpose=purpose,
             expires_minutes=self.otp_expire_minutes,
         )
 
-        success = await self.email_sender.send_email(
-            to_email=email, subject=subject, body=html_body, html=True
+        return await self.email_sender.send_templated_email(
+            to_email=email,
+            subject=subject,
+            body=html_body,
+            values={OTP_CODE_PLACEHOLDER: code},
+            html=True,
         )
 
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to send verification email",
-            )
-
-        return True
-
     async def verify_otp(
         self,
         code: str,
         purpose: str,
         email: str | None = None,
         phone: str | None = None,
-    ) -> OTP:
+    ) -> None:
         """Verify OTP code.
 
         Args:
@@ -153,9 +225,6 @@ class OTPService:
             email: Email associated with OTP
             phone: Phone associated with OTP
 
-        Returns:
-            Verified OTP instance
-
         Raises:
             HTTPException: If OTP is invalid, expired, or max attempts exceeded
         """
@@ -170,8 +239,22 @@ class OTPService:
         if phone:
             filters.append(OTP.phone == phone)
 
-        result = await self.session.execute(select(OTP).where(and_(*filters)))
-        otp = result.scalar_one_or_none()
+        # Every outcome for a matching code consumes it, so the lookup,
+        # attempt count and invalidation are one atomic statement; two
+        # concurrent requests can no longer both redeem the same code.
+        # Only the checked values come back, as a plain row; expiry is
+        # evaluated by the database against the statement's now().
+        result = await self.session.execute(
+            update(OTP)
+            .where(and_(*filters))
+            .values(attempts=OTP.attempts + 1, is_used=True)
+            .returning(
+                OTP.attempts, (OTP.expires_at < func.now()).label("expired")
+            )
+            .execution_options(synchronize_session=False)
+        )
+        otp = result.first()
+        await self.session.commit()
 
         if otp is None:
             raise HTTPException(
@@ -179,29 +262,18 @@ class OTPService:
                 detail="Invalid verification code",
             )
 
-        otp.attempts += 1
-
         if otp.attempts > self.max_attempts:
-            otp.is_used = True
-            await self.session.commit()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Maximum verification attempts exceeded",
             )
 
-        if datetime.now(timezone.utc) > otp.expires_at:
-            otp.is_used = True
-            await self.session.commit()
+        if otp.expired:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Verification code has expired",
             )
 
-        otp.is_used = True
-        await self.session.commit()
-
-        return otp
-
     async def _invalidate_previous_otps(
         self,
         purpose: str,
@@ -211,6 +283,8 @@ class OTPService:
     ) -> None:
         """Invalidate all previous unused OTPs for the same purpose.
 
+        Runs as a single UPDATE; the caller commits.
+
         Args:
             purpose: OTP purpose
             email: Email address
@@ -226,13 +300,12 @@ class OTPService:
         if phone:
             filters.append(OTP.phone == phone)
 
-        result = await self.session.execute(select(OTP).where(and_(*filters)))
-        old_otps = result.scalars().all()
-
-        for old_otp in old_otps:
-            old_otp.is_used = True
-
-        await self.session.commit()
+        await self.session.execute(
+            update(OTP)
+            .where(and_(*filters))
+            .values(is_used=True)
+            .execution_options(synchronize_session=False)
+        )
 
     async def send_welcome_email(self, user: User) -> bool:
         """Send welcome email after successful registration.
@@ -255,3 +328,41 @@ class OTPService:
         )
 
         return success
+
+
+async def prune_expired_otps(
+    session: AsyncSession, retention: timedelta, batch_size: int = 1000
+) -> int:
+    """Delete OTPs that expired more than ``retention`` ago.
+
+    Rows are removed in batches, committing after each one, so the
+    cleanup never holds long locks on the otps table.
+
+    Args:
+        session: SQLAlchemy async session
+        retention: How long to keep OTPs after they expire
+        batch_size: Maximum rows deleted per statement
+
+    Returns:
+        Number of deleted OTPs
+    """
+    cutoff = datetime.now(timezone.utc) - retention
+    expired_ids = (
+        select(OTP.id)
+        .where(OTP.expires_at < cutoff)
+        .limit(batch_size)
+        .scalar_subquery()
+    )
+    stmt = (
+        delete(OTP)
+        .where(OTP.id.in_(expired_ids))
+        .execution_options(synchronize_session=False)
+    )
+
+    deleted = 0
+    while True:
+        result = await session.execute(stmt)
+        await session.commit()
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted
@@ -1,6 +1,7 @@
 """Dependency injection for chat service."""
 
 import logging
+from functools import lru_cache
 from typing import Annotated
 
 from config import get_settings
@@ -14,16 +15,20 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+@lru_cache(maxsize=1)
 def get_qa_service(
     vector_store: Annotated[ChromaVectorStore, Depends(get_vector_store)],
 ) -> QuestionAnsweringService:
     """Dependency injection for QA service.
 
+    The service and its LLM clients are built once per vector store
+    instead of on every request.
+
     Args:
         vector_store: Shared vector store instance
 
     Returns:
-        QuestionAnsweringService instance
+        Shared QuestionAnsweringService instance
     """
     return QuestionAnsweringService(
         vector_store=vector_store,
@@ -1,8 +1,10 @@
 """Chat router for RAG-powered question answering."""
 
+import asyncio
 import logging
 from typing import Annotated, Any
 
+from cache import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from rag_module.services.qa_service import QAResponse, QuestionAnsweringService
@@ -14,6 +16,14 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
+# Recent answers keyed by (query, top_k), so a burst of the same question
+# runs the RAG pipeline once. Entries expire to keep answers fresh.
+ANSWER_CACHE_SIZE = 1024
+ANSWER_CACHE_TTL_SECONDS = 60.0
+_answer_cache: TTLCache[tuple[str, int | None], dict[str, Any]] = TTLCache(
+    ANSWER_CACHE_SIZE, ANSWER_CACHE_TTL_SECONDS
+)
+
 
 @router.post(
     "/ask", response_model=AskResponse, status_code=status.HTTP_200_OK
@@ -34,22 +44,33 @@ async def ask(
     Raises:
         HTTPException: If query processing fails
     """
+    cache_key = (request.query.strip(), request.top_k)
+    cached = _answer_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Answered from cache: '%.100s'", request.query)
+        return cached
+
     try:
-        logger.info(f"Processing query: '{request.query[:100]}'")
+        logger.info("Processing query: '%.100s'", request.query)
 
-        response: QAResponse = qa_service.answer(
-            query=request.query, top_k=request.top_k
+        # The RAG pipeline does blocking vector store and LLM calls; run
+        # it in a worker thread so the event loop keeps serving requests
+        response: QAResponse = await asyncio.to_thread(
+            qa_service.answer, query=request.query, top_k=request.top_k
         )
 
         logger.info(
-            f"Query processed: confidence={response.confidence}, "
-            f"sources={len(response.sources)}"
+            "Query processed: confidence=%s, sources=%d",
+            response.confidence,
+            len(response.sources),
         )
 
-        return response.to_dict()
+        answer = response.to_dict()
+        _answer_cache.set(cache_key, answer)
+        return answer
 
     except Exception as e:
-        logger.error(f"Query processing failed: {e}", exc_info=True)
+        logger.error("Query processing failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to process query: {str(e)}",
@@ -1,5 +1,7 @@
 """Backend service configuration."""
 
+from functools import lru_cache
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -28,6 +30,24 @@ class BackendSettings(BaseSettings):
     async_database_url: str | None = Field(
         default=None, description="PostgreSQL async connection URL"
     )
+    db_pool_size: int = Field(
+        default=20, description="Persistent connections in the DB pool"
+    )
+    db_max_overflow: int = Field(
+        default=40, description="Extra connections allowed under load"
+    )
+    db_pool_recycle: int = Field(
+        default=1800, description="Seconds before a connection is recycled"
+    )
+    db_pool_timeout: int = Field(
+        default=10, description="Seconds to wait for a free connection"
+    )
+    db_statement_cache_size: int = Field(
+        default=500, description="Prepared statements cached per connection"
+    )
+    db_command_timeout: float = Field(
+        default=60, description="Seconds before a query is cancelled"
+    )
 
     chroma_db_path: str = Field(
         default="./chroma_db", description="ChromaDB storage path"
@@ -47,6 +67,9 @@ class BackendSettings(BaseSettings):
     log_format: str = Field(
         default="json", description="Log format: json or text"
     )
+    enable_metrics: bool = Field(
+        default=True, description="Expose Prometheus metrics at /metrics"
+    )
 
     cors_origins: list[str] = Field(
         default=["http://localhost:3000"],
@@ -104,6 +127,12 @@ class BackendSettings(BaseSettings):
     otp_max_attempts: int = Field(
         default=3, description="Maximum OTP verification attempts"
     )
+    otp_retention_hours: int = Field(
+        default=24, description="Hours to keep expired OTPs before pruning"
+    )
+    otp_prune_interval_minutes: int = Field(
+        default=60, description="Interval between expired OTP prunes"
+    )
 
     superuser_email: str = Field(
         default="admin@searchnewsrag.com",
@@ -114,6 +143,11 @@ class BackendSettings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> BackendSettings:
-    """Get backend settings singleton."""
+    """Get backend settings singleton.
+
+    The environment and ``.env`` file are read once per process; call
+    ``get_settings.cache_clear()`` to reload them.
+    """
     return BackendSettings()
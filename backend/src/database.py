@@ -3,6 +3,7 @@
 from collections.abc import AsyncGenerator
 
 from config import get_settings
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -34,12 +35,27 @@ class DatabaseManager:
             SQLAlchemy async engine instance
         """
         if self._engine is None:
+            # Recycle connections instead of pinging on every checkout.
+            # JIT is disabled per connection: the short OLTP queries here
+            # never amortize its planning cost. Each connection keeps the
+            # prepared statements of the hot queries, so they are parsed
+            # once per connection rather than once per request.
             self._engine = create_async_engine(
                 self._database_url,
                 echo=False,
-                pool_pre_ping=True,
-                pool_size=5,
-                max_overflow=10,
+                echo_pool="debug" if settings.debug else False,
+                pool_pre_ping=False,
+                pool_recycle=settings.db_pool_recycle,
+                pool_size=settings.db_pool_size,
+                max_overflow=settings.db_max_overflow,
+                pool_timeout=settings.db_pool_timeout,
+                connect_args={
+                    "server_settings": {"jit": "off"},
+                    "prepared_statement_cache_size": (
+                        settings.db_statement_cache_size
+                    ),
+                    "command_timeout": settings.db_command_timeout,
+                },
             )
         return self._engine
 
@@ -76,6 +92,19 @@ class DatabaseManager:
             finally:
                 await session.close()
 
+    async def ping(self) -> str:
+        """Run a trivial query on a pooled connection.
+
+        Returns:
+            Pool status summary
+
+        Raises:
+            Exception: If no connection can be checked out or used
+        """
+        async with self.engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        return self.engine.pool.status()
+
     async def close(self) -> None:
         """Close database connections."""
         if self._engine is not None:
@@ -1,6 +1,8 @@
 """Shared dependency injection for all services."""
 
 import logging
+import threading
+from functools import cache
 from typing import Annotated
 
 from config import get_settings
@@ -17,71 +19,99 @@ class ServiceContainer:
     """Container for shared application resources."""
 
     def __init__(self) -> None:
-        """Initialize service container."""
+        """Initialize container with no resources built yet."""
         self._vector_store: ChromaVectorStore | None = None
+        self._lock = threading.Lock()
 
     @property
     def vector_store(self) -> ChromaVectorStore:
         """Get or initialize vector store.
 
+        Built once under a lock with double-checked locking: the sync
+        dependency runs in the threadpool, so concurrent first requests
+        would otherwise each build a store and its client.
+
         Returns:
             Initialized ChromaVectorStore instance
 
         Raises:
             RuntimeError: If OpenAI API key is not configured
         """
-        if self._vector_store is None:
-            if not settings.openai_api_key:
-                raise RuntimeError(
-                    "OPENAI_API_KEY environment variable not set"
-                )
-
-            embedding = LangChainEmbedding(model="text-embedding-3-large")
-
-            if settings.chroma_host and settings.chroma_port:
-                logger.info(
-                    f"Using ChromaDB client mode: {settings.chroma_host}:{settings.chroma_port}"
-                )
-                self._vector_store = ChromaVectorStore(
-                    collection_name=settings.chroma_collection_name,
-                    embedding=embedding,
-                    chroma_host=settings.chroma_host,
-                    chroma_port=settings.chroma_port,
-                )
-            else:
-                logger.info(
-                    f"Using ChromaDB embedded mode: {settings.chroma_db_path}"
-                )
-                self._vector_store = ChromaVectorStore(
-                    collection_name=settings.chroma_collection_name,
-                    embedding=embedding,
-                    persist_directory=settings.chroma_db_path,
-                )
-
-            logger.info("ChromaVectorStore initialized")
-
-        return self._vector_store
+        vector_store = self._vector_store
+        if vector_store is not None:
+            return vector_store
 
-    def cleanup(self) -> None:
-        """Cleanup service resources."""
-        if self._vector_store is not None:
-            logger.info("Cleaning up vector store")
-            self._vector_store = None
+        with self._lock:
+            if self._vector_store is None:
+                self._vector_store = self._build_vector_store()
+            return self._vector_store
+
+    @staticmethod
+    def _build_vector_store() -> ChromaVectorStore:
+        """Create vector store from settings.
+
+        Returns:
+            New ChromaVectorStore instance
 
+        Raises:
+            RuntimeError: If OpenAI API key is not configured
+        """
+        if not settings.openai_api_key:
+            raise RuntimeError("OPENAI_API_KEY environment variable not set")
+
+        embedding = LangChainEmbedding(model="text-embedding-3-large")
+
+        if settings.chroma_host and settings.chroma_port:
+            logger.info(
+                "Using ChromaDB client mode: %s:%s",
+                settings.chroma_host,
+                settings.chroma_port,
+            )
+            vector_store = ChromaVectorStore(
+                collection_name=settings.chroma_collection_name,
+                embedding=embedding,
+                chroma_host=settings.chroma_host,
+                chroma_port=settings.chroma_port,
+            )
+        else:
+            logger.info(
+                "Using ChromaDB embedded mode: %s", settings.chroma_db_path
+            )
+            vector_store = ChromaVectorStore(
+                collection_name=settings.chroma_collection_name,
+                embedding=embedding,
+                persist_directory=settings.chroma_db_path,
+            )
+
+        logger.info("ChromaVectorStore initialized")
+
+        return vector_store
+
+    def warm_up(self) -> None:
+        """Build the vector store and prime its embedding client.
+
+        One throwaway query opens the OpenAI connection pool and does the
+        TLS handshake, so request-time embeddings skip connection setup.
+        Blocking; run it in a worker thread from async code.
+        """
+        self.vector_store.embedding.embed_text("warmup")
 
-_container: ServiceContainer | None = None
+    def cleanup(self) -> None:
+        """Cleanup service resources."""
+        with self._lock:
+            if self._vector_store is not None:
+                logger.info("Cleaning up vector store")
+                self._vector_store = None
 
 
+@cache
 def get_container() -> ServiceContainer:
     """Get global service container.
 
     Returns:
         ServiceContainer instance
     """
-    global _container
-    if _container is None:
-        _container = ServiceContainer()
-    return _container
+    return ServiceContainer()
 
 
 def get_vector_store(
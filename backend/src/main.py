@@ -1,20 +1,23 @@
 """FastAPI application for SearchNewsRAG."""
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+from datetime import timedelta
 from typing import AsyncGenerator
 
 import uvicorn
 from admin import setup_admin
 from auth.router import router as auth_router
+from auth.services.otp_service import prune_expired_otps
 from chats.router import router as chat_router
 from config import get_settings
 from database import get_db_manager
 from dependencies import get_container
-from fastapi import FastAPI
+from fastapi import FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi_logging_config import UVICORN_LOG_CONFIG
-from migrations import run_migrations_on_startup
 from news.router import router as news_router
 from prometheus_fastapi_instrumentator import Instrumentator
 from users.router import router as users_router
@@ -22,6 +25,52 @@ from users.router import router as users_router
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Built once; probes get the same bytes without model or JSON encoding
+HEALTH_RESPONSE = Response(
+    content=b'{"status":"healthy"}', media_type="application/json"
+)
+
+
+async def prepare_database() -> None:
+    """Apply pending migrations, then ensure the superuser exists.
+
+    The superuser lives in a migrated table, so the two steps stay in
+    order; each failure is logged without stopping startup.
+    """
+    try:
+        # Startup-only: keeps Alembic out of the import of this module
+        from migrations import run_migrations_on_startup
+
+        await run_migrations_on_startup()
+    except Exception as e:
+        logger.error("Migration failed during startup: %s", e, exc_info=True)
+
+    try:
+        from users.superuser import create_superuser_if_not_exists
+
+        await create_superuser_if_not_exists()
+    except Exception as e:
+        logger.error(
+            "Superuser creation failed during startup: %s", e, exc_info=True
+        )
+
+
+async def warm_up_vector_store() -> None:
+    """Build the shared vector store and open its embedding connections.
+
+    Done at startup rather than on the first request; both steps do
+    blocking I/O, so they run in a worker thread.
+    """
+    if not settings.openai_api_key:
+        return
+
+    try:
+        await asyncio.to_thread(get_container().warm_up)
+    except Exception as e:
+        logger.error(
+            "Vector store initialization failed: %s", e, exc_info=True
+        )
+
 
 async def startup_handler() -> None:
     """Execute startup tasks.
@@ -30,6 +79,9 @@ async def startup_handler() -> None:
     - Database migrations
     - Superuser creation
     - Container initialization
+
+    The database steps and the vector store warm-up are independent and
+    run concurrently.
     """
     logger.info(
         "Starting SearchNewsRAG API",
@@ -39,19 +91,24 @@ async def startup_handler() -> None:
         },
     )
 
-    try:
-        await run_migrations_on_startup()
-    except Exception as e:
-        logger.error(f"Migration failed during startup: {e}", exc_info=True)
+    await asyncio.gather(prepare_database(), warm_up_vector_store())
 
-    try:
-        from users.superuser import create_superuser_if_not_exists
 
-        await create_superuser_if_not_exists()
-    except Exception as e:
-        logger.error(
-            f"Superuser creation failed during startup: {e}", exc_info=True
-        )
+async def prune_otps_periodically() -> None:
+    """Delete expired OTPs on a fixed interval until cancelled."""
+    retention = timedelta(hours=settings.otp_retention_hours)
+    db_manager = get_db_manager()
+
+    while True:
+        try:
+            async with db_manager.session_factory() as session:
+                deleted = await prune_expired_otps(session, retention)
+            if deleted:
+                logger.info("Pruned %s expired OTPs", deleted)
+        except Exception as e:
+            logger.error("OTP pruning failed: %s", e, exc_info=True)
+
+        await asyncio.sleep(settings.otp_prune_interval_minutes * 60)
 
 
 async def shutdown_handler() -> None:
@@ -83,7 +140,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         Control to the application
     """
     await startup_handler()
+
+    prune_task = None
+    if settings.async_database_url:
+        prune_task = asyncio.create_task(prune_otps_periodically())
+
     yield
+
+    if prune_task is not None:
+        prune_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await prune_task
+
     await shutdown_handler()
 
 
@@ -110,17 +178,47 @@ app.include_router(users_router)
 app.include_router(chat_router)
 app.include_router(news_router)
 
-Instrumentator().instrument(app).expose(app, endpoint="/metrics")
+if settings.enable_metrics:
+    # Probes and scrapes are not instrumented, and unmatched paths (404
+    # scans) get no series of their own, keeping label cardinality low
+    Instrumentator(
+        should_group_status_codes=True,
+        should_ignore_untemplated=True,
+        should_instrument_requests_inprogress=False,
+        excluded_handlers=["/health", "/health/db", "/metrics"],
+    ).instrument(app).expose(app, endpoint="/metrics", include_in_schema=False)
 
 
-@app.get("/health")
-async def health_check() -> dict[str, str]:
+@app.get("/health", response_class=Response, include_in_schema=False)
+async def health_check() -> Response:
     """Health check endpoint.
 
     Returns:
-        Service status
+        Prebuilt response with healthy status
     """
-    return {"status": "healthy"}
+    return HEALTH_RESPONSE
+
+
+@app.get("/health/db", include_in_schema=False)
+async def database_health_check() -> ORJSONResponse:
+    """Database health check endpoint.
+
+    Checks a pooled connection out and runs a trivial query, so pool
+    exhaustion or an unreachable server shows up before requests fail.
+
+    Returns:
+        Status and pool summary; 503 if the database is unavailable
+    """
+    try:
+        pool_status = await get_db_manager().ping()
+    except Exception as e:
+        logger.error("Database health check failed: %s", e)
+        return ORJSONResponse(
+            {"status": "unhealthy"},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+
+    return ORJSONResponse({"status": "healthy", "pool": pool_status})
 
 
 if __name__ == "__main__":
@@ -131,4 +229,8 @@ if __name__ == "__main__":
         reload=settings.debug,
         log_level=settings.log_level.lower(),
         log_config=UVICORN_LOG_CONFIG,
+        # Prometheus already records every request in prod
+        access_log=not (
+            settings.environment == "prod" and settings.enable_metrics
+        ),
     )
@@ -11,6 +11,8 @@ from alembic.runtime.migration import MigrationContext
 from alembic.script import ScriptDirectory
 from config import get_settings
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Connection
+from sqlalchemy.pool import NullPool
 
 logger = logging.getLogger(__name__)
 
@@ -44,12 +46,12 @@ def run_migrations_upgrade(revision: str = "head") -> None:
         revision: Target revision (default: 'head' for latest)
     """
     try:
-        logger.info(f"Running migrations to {revision}...")
+        logger.info("Running migrations to %s...", revision)
         config = get_alembic_config()
         command.upgrade(config, revision)
         logger.info("✅ Migrations completed successfully")
     except Exception as e:
-        logger.error(f"❌ Migration failed: {e}", exc_info=True)
+        logger.error("❌ Migration failed: %s", e, exc_info=True)
         raise
 
 
@@ -60,73 +62,122 @@ def run_migrations_downgrade(revision: str = "-1") -> None:
         revision: Target revision (default: '-1' for one step back)
     """
     try:
-        logger.warning(f"Downgrading migrations to {revision}...")
+        logger.warning("Downgrading migrations to %s...", revision)
         config = get_alembic_config()
         command.downgrade(config, revision)
         logger.info("✅ Downgrade completed successfully")
     except Exception as e:
-        logger.error(f"❌ Downgrade failed: {e}", exc_info=True)
+        logger.error("❌ Downgrade failed: %s", e, exc_info=True)
         raise
 
 
-def get_current_revision() -> str | None:
+def get_sync_database_url(config: Config) -> str | None:
+    """Get a synchronous database URL for Alembic checks.
+
+    Args:
+        config: Alembic config object
+
+    Returns:
+        Database URL using the psycopg driver
+    """
+    settings = get_settings()
+    if settings.async_database_url:
+        return settings.async_database_url.replace(
+            "postgresql+asyncpg://", "postgresql+psycopg://"
+        )
+    return config.get_main_option("sqlalchemy.url")
+
+
+def get_current_revision(connection: Connection | None = None) -> str | None:
     """Get current database revision.
 
+    Args:
+        connection: Open connection to reuse; a temporary engine is
+            created when omitted
+
     Returns:
         Current revision ID or None if not initialized
     """
     try:
-        config = get_alembic_config()
-        settings = get_settings()
-        if settings.async_database_url:
-            db_url = settings.async_database_url.replace(
-                "postgresql+asyncpg://", "postgresql+psycopg://"
-            )
-            config.set_main_option("sqlalchemy.url", db_url)
+        if connection is not None:
+            return MigrationContext.configure(
+                connection
+            ).get_current_revision()
 
-        def get_revision(connection):
-            context = MigrationContext.configure(connection)
-            return context.get_current_revision()
-
-        engine = create_engine(config.get_main_option("sqlalchemy.url"))
-        with engine.connect() as connection:
-            return get_revision(connection)
+        engine = create_engine(
+            get_sync_database_url(get_alembic_config()), poolclass=NullPool
+        )
+        try:
+            with engine.connect() as conn:
+                return MigrationContext.configure(conn).get_current_revision()
+        finally:
+            engine.dispose()
     except Exception as e:
-        logger.error(f"Failed to get current revision: {e}")
+        logger.error("Failed to get current revision: %s", e)
         return None
 
 
-def check_migrations_pending() -> bool:
+def check_migrations_pending(connection: Connection | None = None) -> bool:
     """Check if there are pending migrations.
 
+    Args:
+        connection: Open connection to reuse; a temporary engine is
+            created when omitted
+
     Returns:
         True if migrations are pending, False otherwise
     """
     try:
         config = get_alembic_config()
         script = ScriptDirectory.from_config(config)
-        current = get_current_revision()
+        current = get_current_revision(connection)
         head = script.get_current_head()
-        logger.info(f"Current revision: {current}")
-        logger.info(f"Head revision: {head}")
+        logger.info("Current revision: %s", current)
+        logger.info("Head revision: %s", head)
         return current != head
     except Exception as e:
-        logger.error(f"Failed to check migrations: {e}")
+        logger.error("Failed to check migrations: %s", e)
         return False
 
 
+def migrate_database() -> None:
+    """Check for and apply pending migrations over one connection.
+
+    The revision check and the upgrade share a single engine; Alembic's
+    env.py picks the connection up from ``config.attributes``.
+    """
+    config = get_alembic_config()
+    engine = create_engine(get_sync_database_url(config), poolclass=NullPool)
+    try:
+        with engine.connect() as connection:
+            if not check_migrations_pending(connection):
+                logger.info("Database is up-to-date, no migrations needed")
+                return
+
+            # End the check's implicit transaction so Alembic manages its
+            # own; autocommit blocks in migrations require that
+            connection.commit()
+            logger.info("Pending migrations found, upgrading database...")
+            config.attributes["connection"] = connection
+            try:
+                command.upgrade(config, "head")
+            except Exception as e:
+                logger.error("❌ Migration failed: %s", e, exc_info=True)
+                raise
+            logger.info("✅ Migrations completed successfully")
+    finally:
+        engine.dispose()
+
+
 async def run_migrations_on_startup() -> None:
     """Run migrations on application startup.
 
     This function is called during FastAPI lifespan to ensure
-    database is up-to-date before handling requests.
+    database is up-to-date before handling requests. The whole check and
+    upgrade is blocking, so it runs in one worker thread.
     """
     logger.info("Checking database migrations...")
-    if check_migrations_pending():
-        logger.info("Pending migrations found, upgrading database...")
-        await asyncio.to_thread(run_migrations_upgrade)
-    else:
-        logger.info("Database is up-to-date, no migrations needed")
+    await asyncio.to_thread(migrate_database)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 """Dependencies for news module."""
 
+from functools import lru_cache
 from typing import Annotated
 
 from dependencies import get_vector_store
@@ -10,24 +11,32 @@ from rag_module.vector_store import ChromaVectorStore
 from .services import ChromaNewsService, PostgresNewsService
 
 
+@lru_cache(maxsize=1)
 def get_chroma_service(
     vector_store: Annotated[ChromaVectorStore, Depends(get_vector_store)],
 ) -> ChromaNewsService:
     """Get ChromaDB news service instance.
 
+    The service is stateless over the shared vector store, so one
+    instance is reused for as long as that store lives.
+
     Args:
         vector_store: Shared vector store instance
 
     Returns:
-        Initialized ChromaNewsService instance
+        Shared ChromaNewsService instance
     """
     return ChromaNewsService(vector_store=vector_store)
 
 
+@lru_cache(maxsize=1)
 def get_postgres_service() -> PostgresNewsService:
     """Get PostgreSQL news service instance.
 
+    The service keeps no per-request state; sessions are passed to each
+    call, so a single instance is shared.
+
     Returns:
-        PostgresNewsService instance
+        Shared PostgresNewsService instance
     """
     return PostgresNewsService()
@@ -1,13 +1,44 @@
 """Date filtering utilities for news."""
 
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 from .schemas import DateFilter
 
+SECONDS_PER_DAY = 86400
+# Rolling thresholds move in whole minutes so they can be cached
+ROLLING_BUCKET_SECONDS = 60
+
+
+@lru_cache(maxsize=8)
+def _bucket_threshold(date_filter: DateFilter, bucket: int) -> datetime | None:
+    """Calculate the threshold for one time bucket.
+
+    Args:
+        date_filter: Date filter option
+        bucket: Day number for TODAY, minute number otherwise
+
+    Returns:
+        Datetime threshold or None for unknown filters
+    """
+    if date_filter == DateFilter.TODAY:
+        return datetime.fromtimestamp(bucket * SECONDS_PER_DAY, timezone.utc)
+
+    now = datetime.fromtimestamp(bucket * ROLLING_BUCKET_SECONDS, timezone.utc)
+    if date_filter == DateFilter.WEEK:
+        return now - timedelta(days=7)
+    if date_filter == DateFilter.MONTH:
+        return now - timedelta(days=30)
+    return None
+
 
 def calculate_date_threshold(date_filter: DateFilter) -> datetime | None:
     """Calculate date threshold based on filter.
 
+    TODAY starts at UTC midnight; WEEK and MONTH are measured from the
+    start of the current minute, so repeated calls hit the cache.
+
     Args:
         date_filter: Date filter option
 
@@ -17,15 +48,12 @@ def calculate_date_threshold(date_filter: DateFilter) -> datetime | None:
     if date_filter == DateFilter.ALL:
         return None
 
-    now = datetime.now(timezone.utc)
-    thresholds = {
-        DateFilter.TODAY: now.replace(
-            hour=0, minute=0, second=0, microsecond=0
-        ),
-        DateFilter.WEEK: now - timedelta(days=7),
-        DateFilter.MONTH: now - timedelta(days=30),
-    }
-    return thresholds.get(date_filter)
+    bucket_seconds = (
+        SECONDS_PER_DAY
+        if date_filter == DateFilter.TODAY
+        else ROLLING_BUCKET_SECONDS
+    )
+    return _bucket_threshold(date_filter, int(time.time()) // bucket_seconds)
 
 
 def build_chroma_date_filter(date_filter: DateFilter) -> dict | None:
@@ -1,13 +1,33 @@
 """Router for news endpoints."""
 
 import logging
+import re
+from collections.abc import Callable, Coroutine
 from datetime import datetime
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, Any
+from urllib.parse import urlencode
 
+from cache import TTLCache
 from database import get_db_session
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from pagination import paginate
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from pagination import decode_cursor, encode_cursor
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.applications import Starlette
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from users.dependencies import get_current_superuser
+from users.models import User
 
 from .dependencies import get_postgres_service
 from .schemas import (
@@ -15,83 +35,227 @@ from .schemas import (
     CategoryTreeResponse,
     EntityListResponse,
     GraphResponse,
-    NewsItem,
     NewsListResponse,
 )
 from .services import PostgresNewsService
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/news", tags=["news"])
+
+class NewsRoute(APIRoute):
+    """Route that reports unexpected handler errors as JSON 500s.
+
+    Handlers let unexpected errors propagate instead of wrapping each
+    body in its own try/except; the error still goes through the
+    exception middleware, so the response keeps its CORS headers.
+    """
+
+    def get_route_handler(
+        self,
+    ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Wrap the default handler with the shared error reporting."""
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            try:
+                return await handler(request)
+            except (StarletteHTTPException, RequestValidationError):
+                raise
+            except Exception as e:
+                logger.error(
+                    "Failed to handle %s %s: %s",
+                    request.method,
+                    request.url.path,
+                    e,
+                    exc_info=True,
+                )
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Internal server error",
+                ) from e
+
+        return route_handler
+
+
+router = APIRouter(
+    prefix="/news",
+    tags=["news"],
+    default_response_class=ORJSONResponse,
+    route_class=NewsRoute,
+)
+
+NEWS_IDS_PATTERN = re.compile(r"[\d\s,]*")
+
+# Aggregates over the whole archive only change when new articles are
+# ingested, so they are served from memory for a short while
+NEWS_CACHE_SIZE = 1024
+NEWS_CACHE_TTL_SECONDS = 60.0
+_news_cache: TTLCache[tuple[Any, ...], dict] = TTLCache(
+    NEWS_CACHE_SIZE, NEWS_CACHE_TTL_SECONDS
+)
+
+# Clients polling the aggregates revalidate against the ingest epoch,
+# which is itself re-read at most every few seconds
+INGEST_EPOCH_TTL_SECONDS = 5.0
+AGGREGATE_CACHE_CONTROL = "public, max-age=30"
+_epoch_cache: TTLCache[str, str] = TTLCache(1, INGEST_EPOCH_TTL_SECONDS)
+
+
+async def _get_ingest_epoch(
+    session: AsyncSession, service: PostgresNewsService
+) -> str:
+    """Return the ingest epoch, querying it at most every few seconds.
+
+    The epoch is read from the database only, so every worker issues
+    the same ETag for the same data.
+
+    Args:
+        session: Database session
+        service: PostgreSQL news service
+
+    Returns:
+        Current ingest epoch
+    """
+    epoch = _epoch_cache.get("epoch")
+    if epoch is None:
+        epoch = await service.get_ingest_epoch(session)
+        _epoch_cache.set("epoch", epoch)
+    return epoch
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client already holds the current representation.
+
+    Args:
+        request: Incoming request
+        etag: Current entity tag
+
+    Returns:
+        True if ``If-None-Match`` lists the tag or is a wildcard
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return any(tag.strip() in (etag, "*") for tag in header.split(","))
 
 
 @router.get("/categories", response_model=CategoriesResponse)
 async def get_categories(
+    request: Request,
+    response: Response,
     session: Annotated[AsyncSession, Depends(get_db_session)],
     service: Annotated[PostgresNewsService, Depends(get_postgres_service)],
     source: str | None = Query(None, description="Filter by source name"),
-) -> dict:
+) -> dict | Response:
     """Get all news categories with document counts from PostgreSQL.
 
+    Answers ``304 Not Modified`` when the client's ``If-None-Match``
+    matches the current ingest epoch.
+
     Args:
+        request: Incoming request
+        response: Outgoing response, used for the caching headers
         session: Database session
         service: PostgreSQL news service
         source: Optional source name filter
 
     Returns:
         List of categories with their document counts
-
-    Raises:
-        HTTPException: If failed to retrieve categories
     """
-    try:
-        logger.info(f"Fetching categories from DB, source={source}")
-
-        categories = await service.get_categories_with_count(
-            session, source_name=source
+    epoch = await _get_ingest_epoch(session, service)
+    headers = {
+        "ETag": f'W/"{epoch}"',
+        "Cache-Control": AGGREGATE_CACHE_CONTROL,
+    }
+    if _etag_matches(request, headers["ETag"]):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
         )
-        total = sum(cat["count"] for cat in categories)
+    response.headers.update(headers)
 
-        logger.info(
-            f"Categories retrieved: {len(categories)} categories, {total} total documents"
-        )
+    cache_key = ("categories", source, epoch)
+    cached = _news_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-        return {"categories": categories, "total_documents": total}
+    logger.info("Fetching categories from DB, source=%s", source)
 
-    except Exception as e:
-        logger.error(f"Failed to fetch categories: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve categories: {str(e)}",
-        ) from e
+    categories = await service.get_categories_with_count(
+        session, source_name=source
+    )
+    total = sum(cat["count"] for cat in categories)
 
+    logger.info(
+        "Categories retrieved: %s categories, %s total documents",
+        len(categories),
+        total,
+    )
 
-def _map_news_item(item: dict) -> NewsItem:
-    """Map DB dict to NewsItem schema.
+    body = {"categories": categories, "total_documents": total}
+    _news_cache.set(cache_key, body)
+    return body
+
+
+def _map_news_item(item: dict) -> dict[str, Any]:
+    """Map DB dict to a NewsItem-shaped dict.
+
+    The values come straight from our own serializer, so the item is
+    handed to orjson as is instead of going through the model.
 
     Args:
         item: Raw DB dict
 
     Returns:
-        NewsItem instance
+        Dict with the NewsItem fields
     """
-    date_val = item.get("date")
-    date_obj: datetime | None = None
-    if isinstance(date_val, str):
-        try:
-            date_obj = datetime.fromisoformat(date_val)
-        except Exception:
-            date_obj = None
-    elif isinstance(date_val, datetime):
-        date_obj = date_val
-
-    return NewsItem(
-        id=str(item["id"]),
-        content=item.get("full_content") or item.get("short_preview") or "",
-        category=item.get("category"),
-        date=date_obj,
-        importance=item.get("importance"),
-    )
+    return {
+        "id": str(item["id"]),
+        "content": item["full_content"] or item["short_preview"] or "",
+        "category": item["category"],
+        "date": item["date"],
+        "importance": item["importance"],
+    }
+
+
+@lru_cache(maxsize=32)
+def _route_path(app: Starlette, name: str) -> str:
+    """Resolve a route path once per application.
+
+    Args:
+        app: Application owning the route
+        name: Route name
+
+    Returns:
+        Route path without host or root path
+    """
+    return str(app.url_path_for(name))
+
+
+def _decode_news_cursor(cursor: str) -> tuple[datetime | None, int]:
+    """Decode a news list cursor into its ``(date, id)`` position.
+
+    Args:
+        cursor: Cursor from a previous ``next`` link
+
+    Returns:
+        Date and id of the last article already seen
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        date_val, article_id = decode_cursor(cursor)
+        if not isinstance(article_id, int):
+            raise ValueError("Cursor id must be an integer")
+        date_obj = (
+            datetime.fromisoformat(date_val) if date_val is not None else None
+        )
+    except (TypeError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        ) from e
+    return date_obj, article_id
 
 
 @router.get("/", response_model=NewsListResponse)
@@ -105,9 +269,17 @@ async def get_news(
     page_size: int = Query(
         20, ge=1, le=100, description="Items per page (max 100)"
     ),
-) -> dict:
+    cursor: str | None = Query(
+        None, description="Position from a previous 'next' link"
+    ),
+) -> ORJSONResponse:
     """Get paginated news list from PostgreSQL.
 
+    ``next`` links carry a keyset cursor, so following them seeks to
+    the position instead of skipping rows; ``page`` still works for
+    direct jumps. When a cursor is given, ``page`` only numbers the
+    page, so ``previous`` can link back to it.
+
     Args:
         request: FastAPI request object for building URLs
         session: Database session
@@ -116,69 +288,90 @@ async def get_news(
         category: Optional category filter
         page: Page number (1-indexed)
         page_size: Number of items per page
+        cursor: Keyset cursor of the page to fetch
 
     Returns:
         Paginated list with count, next, previous, and results
 
     Raises:
-        HTTPException: If failed to retrieve news
+        HTTPException: If the cursor is invalid
     """
-    try:
-        logger.info(
-            f"Fetching news: source={source}, category={category}, "
-            f"page={page}, page_size={page_size}"
-        )
+    after = _decode_news_cursor(cursor) if cursor is not None else None
+
+    logger.info(
+        "Fetching news: source=%s, category=%s, page=%s, page_size=%s, "
+        "cursor=%s",
+        source,
+        category,
+        page,
+        page_size,
+        cursor,
+    )
 
-        offset = (page - 1) * page_size
+    # One extra row tells whether another page follows
+    if after is not None:
+        news = await service.get_news_list_keyset(
+            session,
+            source_name=source,
+            category=category,
+            limit=page_size + 1,
+            after=after,
+        )
+    else:
         news = await service.get_news_list(
             session,
             source_name=source,
             category=category,
-            limit=page_size,
-            offset=offset,
+            limit=page_size + 1,
+            offset=(page - 1) * page_size,
         )
-
+    has_next = len(news) > page_size
+    if has_next:
+        del news[page_size:]
+
+    # Page mode reads the windowed count off its rows; cursor pages
+    # and a page past the end need their own COUNT
+    if after is None and news:
+        total = news[0]["total_count"]
+    else:
         total = await service.get_total_count(
             session, source_name=source, category=category
         )
 
-        base_url = str(request.url_for("get_news"))
-        query_params: dict[str, str | int] = {"page_size": page_size}
-        if source:
-            query_params["source"] = source
-        if category:
-            query_params["category"] = category
-
-        mapped_news = [_map_news_item(n) for n in news]
-
-        paginated = paginate(
-            items=mapped_news,
-            page=page,
-            page_size=page_size,
-            base_url=base_url,
-            query_params=query_params,
-            total=total,
+    # Filters are encoded once and shared by both links
+    query_params: dict[str, str | int] = {"page_size": page_size}
+    if source:
+        query_params["source"] = source
+    if category:
+        query_params["category"] = category
+    link_prefix = (
+        f"{str(request.base_url).rstrip('/')}"
+        f"{_route_path(request.app, 'get_news')}?{urlencode(query_params)}"
+    )
+
+    next_url = None
+    if has_next:
+        last = news[-1]
+        cursor_param = urlencode(
+            {"cursor": encode_cursor([last["date"], last["id"]])}
         )
+        next_url = f"{link_prefix}&page={page + 1}&{cursor_param}"
 
-        response = {
-            "count": paginated["count"],
-            "next": paginated["next"],
-            "previous": paginated["previous"],
-            "results": {"news": paginated["results"]},
-        }
+    # Backward links jump by page number; the keyset only runs forward
+    previous_url = f"{link_prefix}&page={page - 1}" if page > 1 else None
 
-        logger.info(
-            f"News retrieved: {len(mapped_news)} items (page {page}, total {total})"
-        )
+    response = {
+        "count": total,
+        "next": next_url,
+        "previous": previous_url,
+        "results": {"news": [_map_news_item(n) for n in news]},
+    }
 
-        return response
+    logger.info(
+        "News retrieved: %s items (page %s, total %s)", len(news), page, total
+    )
 
-    except Exception as e:
-        logger.error(f"Failed to fetch news: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve news: {str(e)}",
-        ) from e
+    return ORJSONResponse(response)
 
 
 @router.get("/graph", response_model=GraphResponse)
@@ -190,7 +383,7 @@ async def get_news_graph(
     limit: int = Query(
         30, ge=5, le=100, description="Max news items in graph"
     ),
-) -> dict:
+) -> ORJSONResponse:
     """Get news graph data for visualization.
 
     Returns nodes (news articles + entities) and edges (connections).
@@ -204,79 +397,82 @@ async def get_news_graph(
 
     Returns:
         Graph data with nodes and edges for visualization
-
-    Raises:
-        HTTPException: If failed to retrieve graph data
     """
-    try:
-        logger.info(
-            f"Fetching graph data: category={category}, entity={entity}, limit={limit}"
-        )
-
-        graph_data = await service.get_graph_data(
-            session,
-            category=category,
-            entity_name=entity,
-            limit=limit,
-        )
+    logger.info(
+        "Fetching graph data: category=%s, entity=%s, limit=%s",
+        category,
+        entity,
+        limit,
+    )
 
-        logger.info(
-            f"Graph data retrieved: {graph_data['total_news']} news, "
-            f"{graph_data['total_entities']} entities"
-        )
+    graph_data = await service.get_graph_data(
+        session,
+        category=category,
+        entity_name=entity,
+        limit=limit,
+    )
 
-        return graph_data
+    logger.info(
+        "Graph data retrieved: %s news, %s entities",
+        graph_data["total_news"],
+        graph_data["total_entities"],
+    )
 
-    except Exception as e:
-        logger.error(f"Failed to fetch graph data: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve graph data: {str(e)}",
-        ) from e
+    return ORJSONResponse(graph_data)
 
 
 @router.get("/category-tree", response_model=CategoryTreeResponse)
 async def get_category_tree(
+    request: Request,
     session: Annotated[AsyncSession, Depends(get_db_session)],
     service: Annotated[PostgresNewsService, Depends(get_postgres_service)],
     limit_per_category: int = Query(
         20, ge=5, le=50, description="Max news per category"
     ),
-) -> dict:
+) -> Response:
     """Get hierarchical category tree with subcategories and news.
 
+    Answers ``304 Not Modified`` when the client's ``If-None-Match``
+    matches the current ingest epoch.
+
     Args:
+        request: Incoming request
         session: Database session
         service: PostgreSQL news service
         limit_per_category: Maximum news items per category
 
     Returns:
         Category tree structure
-
-    Raises:
-        HTTPException: If failed to retrieve category tree
     """
-    try:
-        logger.info(
-            f"Fetching category tree, limit_per_category={limit_per_category}"
+    # Keyed on the ingest epoch so new or re-analysed news shows up
+    # without waiting for the entry to expire
+    epoch = await _get_ingest_epoch(session, service)
+    headers = {
+        "ETag": f'W/"{epoch}"',
+        "Cache-Control": AGGREGATE_CACHE_CONTROL,
+    }
+    if _etag_matches(request, headers["ETag"]):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
         )
 
-        tree_data = await service.get_category_tree(
-            session, limit_per_category
-        )
+    cache_key = ("category_tree", limit_per_category, epoch)
+    cached = _news_cache.get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached, headers=headers)
 
-        logger.info(
-            f"Category tree retrieved: {len(tree_data['categories'])} categories"
-        )
+    logger.info(
+        "Fetching category tree, limit_per_category=%s", limit_per_category
+    )
 
-        return tree_data
+    tree_data = await service.get_category_tree(session, limit_per_category)
 
-    except Exception as e:
-        logger.error(f"Failed to fetch category tree: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve category tree: {str(e)}",
-        ) from e
+    logger.info(
+        "Category tree retrieved: %s categories", len(tree_data["categories"])
+    )
+
+    _news_cache.set(cache_key, tree_data)
+    return ORJSONResponse(tree_data, headers=headers)
 
 
 @router.get("/entities", response_model=EntityListResponse)
@@ -300,25 +496,20 @@ async def get_entities(
 
     Returns:
         Entity list with news connections
-
-    Raises:
-        HTTPException: If failed to retrieve entities
     """
-    try:
-        logger.info(f"Fetching entities, min_news={min_news}, limit={limit}")
+    cache_key = ("entities", min_news, limit)
+    cached = _news_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-        entity_data = await service.get_entity_list(session, min_news, limit)
+    logger.info("Fetching entities, min_news=%s, limit=%s", min_news, limit)
 
-        logger.info(f"Entities retrieved: {entity_data['total']} entities")
+    entity_data = await service.get_entity_list(session, min_news, limit)
 
-        return entity_data
+    logger.info("Entities retrieved: %s entities", entity_data["total"])
 
-    except Exception as e:
-        logger.error(f"Failed to fetch entities: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve entities: {str(e)}",
-        ) from e
+    _news_cache.set(cache_key, entity_data)
+    return entity_data
 
 
 @router.get("/entity-graph", response_model=GraphResponse)
@@ -338,34 +529,42 @@ async def get_entity_graph(
 
     Returns:
         Graph with news connected by shared entities
-
-    Raises:
-        HTTPException: If failed to retrieve entity graph
     """
-    try:
-        logger.info(
-            f"Fetching entity graph, entity_id={entity_id}, limit={limit}"
-        )
+    logger.info(
+        "Fetching entity graph, entity_id=%s, limit=%s", entity_id, limit
+    )
 
-        graph_data = await service.get_entity_graph(
-            session,
-            entity_id=entity_id,
-            limit=limit,
-        )
+    graph_data = await service.get_entity_graph(
+        session,
+        entity_id=entity_id,
+        limit=limit,
+    )
 
-        logger.info(
-            f"Entity graph retrieved: {graph_data['total_news']} news, "
-            f"{graph_data['total_entities']} entities"
-        )
+    logger.info(
+        "Entity graph retrieved: %s news, %s entities",
+        graph_data["total_news"],
+        graph_data["total_entities"],
+    )
 
-        return graph_data
+    return graph_data
 
-    except Exception as e:
-        logger.error(f"Failed to fetch entity graph: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve entity graph: {str(e)}",
-        ) from e
+
+@lru_cache(maxsize=256)
+def _parse_news_ids(ids: str) -> tuple[int, ...]:
+    """Parse a comma-separated id list, skipping empty items.
+
+    Args:
+        ids: Comma-separated news IDs
+
+    Returns:
+        Parsed IDs
+
+    Raises:
+        ValueError: If an item is not a non-negative integer
+    """
+    if not NEWS_IDS_PATTERN.fullmatch(ids):
+        raise ValueError(f"expected comma-separated integers, got {ids!r}")
+    return tuple(int(x) for x in ids.split(",") if x.strip())
 
 
 @router.get("/by-ids", response_model=GraphResponse)
@@ -385,28 +584,40 @@ async def get_news_by_ids(
         Graph with specified news items
 
     Raises:
-        HTTPException: If failed to retrieve news
+        HTTPException: If the IDs are malformed
     """
     try:
-        news_ids = [int(x.strip()) for x in ids.split(",") if x.strip()]
-        logger.info(
-            f"Fetching news by ids: {news_ids[:5]}... (total: {len(news_ids)})"
-        )
-
-        graph_data = await service.get_news_by_ids(session, news_ids)
-
-        logger.info(f"News by ids retrieved: {graph_data['total_news']} news")
-
-        return graph_data
-
+        news_ids = list(_parse_news_ids(ids))
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid IDs format: {str(e)}",
         ) from e
-    except Exception as e:
-        logger.error(f"Failed to fetch news by ids: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve news: {str(e)}",
-        ) from e
+
+    logger.info(
+        "Fetching news by ids: %s... (total: %s)", news_ids[:5], len(news_ids)
+    )
+
+    graph_data = await service.get_news_by_ids(session, news_ids)
+
+    logger.info("News by ids retrieved: %s news", graph_data["total_news"])
+
+    return graph_data
+
+
+@router.delete("/cache", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_news_cache(
+    current_user: Annotated[User, Depends(get_current_superuser)],
+) -> None:
+    """Drop cached news aggregates (superuser only).
+
+    Call after an ingest so new counts show up before the cache expires.
+    The ingest epoch is re-read on the next request, so ETags change as
+    soon as the data does. Only this worker's cache is cleared.
+
+    Args:
+        current_user: Current superuser
+    """
+    _news_cache.clear()
+    _epoch_cache.clear()
+    logger.info("News cache cleared by user %s", current_user.id)
@@ -4,9 +4,9 @@ from typing import Any
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload, undefer
 
-from rag_module.db.models import Article, Source
+from rag_module.db.models import Article, ArticleEntity, Source
 
 from .protocols import ICategoryService
 
@@ -48,11 +48,20 @@ class CategoryService(ICategoryService):
         limit_per_category: int = 20,
     ) -> dict[str, Any]:
         """Get hierarchical category tree with subcategories and news."""
+        # Only the columns the tree shows; titles come from the stored
+        # preview instead of the full article text
         query = (
             select(Article)
             .options(
+                load_only(
+                    Article.id,
+                    Article.category,
+                    Article.short_preview,
+                    Article.date,
+                    Article.importance,
+                ),
+                undefer(Article.content_preview),
                 selectinload(Article.subcategories),
-                selectinload(Article.entities),
             )
             .where(Article.category.isnot(None))
             .order_by(Article.date.desc())
@@ -61,6 +70,22 @@ class CategoryService(ICategoryService):
         result = await session.execute(query)
         articles = result.scalars().all()
 
+        # Entity ids per article, aggregated by the database in one query
+        # rather than loading every linked Entity row
+        entity_query = (
+            select(
+                ArticleEntity.article_id,
+                func.array_agg(ArticleEntity.entity_id),
+            )
+            .join(Article, Article.id == ArticleEntity.article_id)
+            .where(Article.category.isnot(None))
+            .group_by(ArticleEntity.article_id)
+        )
+        entity_result = await session.execute(entity_query)
+        article_entity_ids: dict[int, list[int]] = dict(
+            entity_result.tuples().all()
+        )
+
         category_map: dict[str, dict[str, Any]] = {}
 
         for article in articles:
@@ -76,22 +101,18 @@ class CategoryService(ICategoryService):
 
             category_map[cat_name]["count"] += 1
 
-            entity_ids = (
-                [e.id for e in article.entities] if article.entities else []
-            )
-
             news_item = {
                 "id": article.id,
-                "title": (article.short_preview or article.full_content or "")[
-                    :100
-                ],
+                "title": (
+                    article.short_preview or article.content_preview or ""
+                )[:100],
                 "date": (
                     article.date.strftime("%Y-%m-%d %H:%M")
                     if article.date
                     else None
                 ),
                 "importance": article.importance,
-                "entity_ids": entity_ids,
+                "entity_ids": article_entity_ids.get(article.id, []),
             }
 
             if article.subcategories:
@@ -132,3 +153,19 @@ class CategoryService(ICategoryService):
             "categories": categories,
             "total_news": len(articles),
         }
+
+    async def get_ingest_epoch(self, session: AsyncSession) -> str:
+        """Get a marker that changes whenever articles are written.
+
+        Combines the latest ``updated_at``, which moves on inserts and
+        on in-place re-analysis, with the row count, which moves on
+        deletes.
+        """
+        result = await session.execute(
+            select(func.max(Article.updated_at), func.count()).select_from(
+                Article
+            )
+        )
+        last_update, total = result.one()
+        stamp = int(last_update.timestamp() * 1_000_000) if last_update else 0
+        return f"{stamp:x}-{total:x}"
@@ -1,5 +1,6 @@
 """Facade combining all news services for backward compatibility."""
 
+from datetime import datetime
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -39,6 +40,19 @@ class PostgresNewsService:
             session, source_name, category, limit, offset
         )
 
+    async def get_news_list_keyset(
+        self,
+        session: AsyncSession,
+        source_name: str | None = None,
+        category: str | None = None,
+        limit: int = 50,
+        after: tuple[datetime | None, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get news list page following a ``(date, id)`` position."""
+        return await self._news_list.get_news_list_keyset(
+            session, source_name, category, limit, after
+        )
+
     async def get_total_count(
         self,
         session: AsyncSession,
@@ -70,6 +84,10 @@ class PostgresNewsService:
             session, limit_per_category
         )
 
+    async def get_ingest_epoch(self, session: AsyncSession) -> str:
+        """Get a marker that changes whenever articles are written."""
+        return await self._category.get_ingest_epoch(session)
+
     async def get_entity_list(
         self,
         session: AsyncSession,
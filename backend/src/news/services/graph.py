@@ -4,11 +4,11 @@ import math
 import random
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import ARRAY, Integer, Select, any_, bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, load_only, selectinload
 
-from rag_module.db.models import Article, ArticleEntity, Entity
+from rag_module.db.models import Article, ArticleEntity, Entity, Source
 
 from .protocols import IGraphService
 
@@ -16,6 +16,30 @@ from .protocols import IGraphService
 class GraphService(IGraphService):
     """Service for graph visualization operations."""
 
+    @staticmethod
+    def _graph_query() -> Select[tuple[Article]]:
+        """Build the article query shared by all graph endpoints.
+
+        Only the columns used by the nodes are loaded. The source comes
+        in through a join and the entities through a single selectin
+        query, so each graph costs two round trips instead of three.
+        """
+        return select(Article).options(
+            load_only(
+                Article.url,
+                Article.date,
+                Article.short_preview,
+                Article.full_content,
+                Article.summary,
+                Article.category,
+                Article.sentiment,
+                Article.importance,
+                Article.is_high_importance,
+            ),
+            joinedload(Article.source).load_only(Source.name),
+            selectinload(Article.entities).load_only(Entity.text),
+        )
+
     async def get_graph_data(
         self,
         session: AsyncSession,
@@ -24,15 +48,7 @@ class GraphService(IGraphService):
         limit: int = 30,
     ) -> dict[str, Any]:
         """Get graph visualization data for news network."""
-        query = (
-            select(Article)
-            .options(
-                selectinload(Article.entities),
-                selectinload(Article.source),
-            )
-            .order_by(Article.date.desc())
-            .limit(limit)
-        )
+        query = self._graph_query().order_by(Article.date.desc()).limit(limit)
 
         if category:
             query = query.where(Article.category == category.lower().strip())
@@ -45,8 +61,7 @@ class GraphService(IGraphService):
             )
             query = query.where(Article.id.in_(entity_subquery))
 
-        result = await session.execute(query)
-        articles = list(result.scalars().all())
+        articles = list(await session.scalars(query))
 
         nodes, entity_to_articles = self._build_nodes(articles)
         edges = self._build_edges_by_entities(entity_to_articles)
@@ -68,29 +83,19 @@ class GraphService(IGraphService):
         limit: int = 50,
     ) -> dict[str, Any]:
         """Get graph of news connected by shared entities."""
-        news_ids: list[int] = []
-        if entity_id:
-            article_ids_query = select(ArticleEntity.article_id).where(
-                ArticleEntity.entity_id == entity_id
-            )
-            article_ids_result = await session.execute(article_ids_query)
-            news_ids = [row[0] for row in article_ids_result.all()]
+        query = self._graph_query().order_by(Article.date.desc()).limit(limit)
 
-        query = (
-            select(Article)
-            .options(
-                selectinload(Article.entities),
-                selectinload(Article.source),
+        if entity_id:
+            # Filtered in the same query instead of fetching ids first
+            query = query.where(
+                Article.id.in_(
+                    select(ArticleEntity.article_id).where(
+                        ArticleEntity.entity_id == entity_id
+                    )
+                )
             )
-            .order_by(Article.date.desc())
-            .limit(limit)
-        )
-
-        if news_ids:
-            query = query.where(Article.id.in_(news_ids))
 
-        result = await session.execute(query)
-        articles = list(result.scalars().all())
+        articles = list(await session.scalars(query))
 
         return self._build_entity_connected_graph(articles)
 
@@ -101,17 +106,17 @@ class GraphService(IGraphService):
     ) -> dict[str, Any]:
         """Get news graph by specific IDs connected by shared entities."""
         query = (
-            select(Article)
-            .options(
-                selectinload(Article.entities),
-                selectinload(Article.source),
+            self._graph_query()
+            # One array parameter keeps the statement text identical for
+            # any number of ids, so the prepared plan is reused
+            .where(
+                Article.id
+                == any_(bindparam("news_ids", news_ids, type_=ARRAY(Integer)))
             )
-            .where(Article.id.in_(news_ids))
             .order_by(Article.date.desc())
         )
 
-        result = await session.execute(query)
-        articles = list(result.scalars().all())
+        articles = list(await session.scalars(query))
 
         return self._build_entity_connected_graph(articles)
 
@@ -1,14 +1,18 @@
 """News list service implementation."""
 
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from rag_module.db.models import Article, Source
 
 from .protocols import INewsListService
 
+# Newest first; id breaks ties so every row has a unique position
+NEWS_ORDER = (Article.date.desc().nulls_last(), Article.id.desc())
+
 
 class NewsListService(INewsListService):
     """Service for retrieving paginated news lists."""
@@ -21,23 +25,72 @@ class NewsListService(INewsListService):
         limit: int = 50,
         offset: int = 0,
     ) -> list[dict[str, Any]]:
-        """Get paginated news list from database."""
-        query = (
-            select(Article)
-            .join(Source)
-            .order_by(Article.date.desc())
-            .limit(limit)
-            .offset(offset)
+        """Get paginated news list from database.
+
+        Each item carries ``total_count``, the number of articles
+        matching the filters, computed by a window function in the same
+        query instead of a separate COUNT round-trip.
+        """
+        query = self._filter(
+            select(Article, func.count().over().label("total_count")).join(
+                Source
+            ),
+            source_name,
+            category,
         )
+        query = query.order_by(*NEWS_ORDER).limit(limit).offset(offset)
 
-        if source_name:
-            query = query.where(Source.name == source_name)
+        result = await session.execute(query)
 
-        if category:
-            query = query.where(Article.category == category.lower().strip())
+        return [
+            {**self._serialize_article(article), "total_count": total_count}
+            for article, total_count in result.tuples()
+        ]
 
-        result = await session.execute(query)
-        articles = result.scalars().all()
+    async def get_news_list_keyset(
+        self,
+        session: AsyncSession,
+        source_name: str | None = None,
+        category: str | None = None,
+        limit: int = 50,
+        after: tuple[datetime | None, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get the news page following the ``(date, id)`` of a seen row.
+
+        Seeks straight to the position instead of skipping ``offset``
+        rows, so deep pages cost the same as the first one. Dated and
+        undated articles are read by separate queries: each predicate
+        is then a plain seek on the ``(date, id)`` indexes, which an
+        OR of the two would prevent. Undated articles sort last, so
+        they only top up a page the dated ones leave short.
+        """
+        base = self._filter(
+            select(Article).join(Source), source_name, category
+        )
+        after_date, after_id = after if after is not None else (None, None)
+
+        articles: list[Article] = []
+        if after is None or after_date is not None:
+            dated = base.where(Article.date.is_not(None))
+            if after is not None:
+                dated = dated.where(
+                    tuple_(Article.date, Article.id)
+                    < tuple_(after_date, after_id)
+                )
+            result = await session.execute(
+                dated.order_by(*NEWS_ORDER).limit(limit)
+            )
+            articles.extend(result.scalars())
+
+        remaining = limit - len(articles)
+        if remaining > 0:
+            undated = base.where(Article.date.is_(None))
+            if after_date is None and after_id is not None:
+                undated = undated.where(Article.id < after_id)
+            result = await session.execute(
+                undated.order_by(Article.id.desc()).limit(remaining)
+            )
+            articles.extend(result.scalars())
 
         return [self._serialize_article(article) for article in articles]
 
@@ -48,16 +101,25 @@ class NewsListService(INewsListService):
         category: str | None = None,
     ) -> int:
         """Get total number of articles."""
-        query = select(func.count(Article.id)).join(Source)
+        query = self._filter(
+            select(func.count(Article.id)).join(Source), source_name, category
+        )
 
+        result = await session.execute(query)
+        return result.scalar_one()
+
+    @staticmethod
+    def _filter(
+        query: Select[Any], source_name: str | None, category: str | None
+    ) -> Select[Any]:
+        """Apply the source and category filters to a news query."""
         if source_name:
             query = query.where(Source.name == source_name)
 
         if category:
             query = query.where(Article.category == category.lower().strip())
 
-        result = await session.execute(query)
-        return result.scalar_one()
+        return query
 
     def _serialize_article(self, article: Article) -> dict[str, Any]:
         """Serialize article to dictionary."""
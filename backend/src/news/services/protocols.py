@@ -1,6 +1,7 @@
 """Protocol definitions for news services."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,6 +21,17 @@ class INewsListService(ABC):
     ) -> list[dict[str, Any]]:
         """Get paginated news list."""
 
+    @abstractmethod
+    async def get_news_list_keyset(
+        self,
+        session: AsyncSession,
+        source_name: str | None = None,
+        category: str | None = None,
+        limit: int = 50,
+        after: tuple[datetime | None, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get news list page following a ``(date, id)`` position."""
+
     @abstractmethod
     async def get_total_count(
         self,
@@ -49,6 +61,10 @@ class ICategoryService(ABC):
     ) -> dict[str, Any]:
         """Get hierarchical category tree."""
 
+    @abstractmethod
+    async def get_ingest_epoch(self, session: AsyncSession) -> str:
+        """Get a marker that changes whenever articles are written."""
+
 
 class IEntityService(ABC):
     """Interface for entity operations."""
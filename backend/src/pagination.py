@@ -1,8 +1,11 @@
 """Generic pagination utilities for all services."""
 
+import base64
+import binascii
 from typing import Any, Generic, TypeVar
 from urllib.parse import urlencode
 
+import orjson
 from pydantic import BaseModel, Field
 
 T = TypeVar("T")
@@ -45,6 +48,39 @@ def build_pagination_url(
     return f"{base_url}?{query_string}"
 
 
+def encode_cursor(values: list[Any]) -> str:
+    """Encode keyset position values as an opaque cursor.
+
+    Args:
+        values: JSON-serializable values identifying the last seen row
+
+    Returns:
+        URL-safe cursor string
+    """
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode()
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor string from a ``next`` link
+
+    Returns:
+        Keyset position values
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor))
+    except (binascii.Error, orjson.JSONDecodeError) as e:
+        raise ValueError("Malformed cursor") from e
+    if not isinstance(values, list):
+        raise ValueError("Malformed cursor")
+    return values
+
+
 def paginate(
     items: list[T],
     page: int,
@@ -1,5 +1,6 @@
 """Dependencies for authentication and authorization."""
 
+from functools import lru_cache
 from typing import Annotated
 
 from auth.services.auth_service import AuthService
@@ -20,11 +21,12 @@ settings = get_settings()
 security = HTTPBearer()
 
 
+@lru_cache
 def get_jwt_handler() -> JWTHandler:
-    """Get JWT handler instance.
+    """Get shared JWT handler instance.
 
     Returns:
-        Configured JWT handler
+        Configured JWT handler, created once per process
 
     Raises:
         RuntimeError: If JWT_SECRET_KEY is not configured
@@ -49,11 +51,13 @@ def get_password_hasher() -> PasswordHasher:
     return PasswordHasher()
 
 
+@lru_cache
 def get_email_sender() -> SMTPEmailSender:
-    """Get email sender instance.
+    """Get shared email sender instance.
 
     Returns:
-        Configured email sender
+        Configured email sender, reusing its SMTP connections across
+        requests
     """
     return SMTPEmailSender(
         smtp_host=settings.smtp_host,
@@ -8,10 +8,12 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
     Text,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -44,18 +46,32 @@ group_permissions = Table(
 )
 
 
+LOGIN_COLUMNS = ["id", "hashed_password", "is_active", "is_verified"]
+
+
 class User(Base):
     """User model for authentication and authorization."""
 
     __tablename__ = "users"
-
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    email: Mapped[str] = mapped_column(
-        String(255), unique=True, index=True, nullable=False
-    )
-    phone: Mapped[str] = mapped_column(
-        String(20), unique=True, index=True, nullable=False
+    __table_args__ = (
+        # Covering indexes so the login lookup is an index-only scan
+        Index(
+            "ix_users_email_login",
+            "email",
+            unique=True,
+            postgresql_include=LOGIN_COLUMNS,
+        ),
+        Index(
+            "ix_users_phone_login",
+            "phone",
+            unique=True,
+            postgresql_include=LOGIN_COLUMNS,
+        ),
     )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
+    phone: Mapped[str] = mapped_column(String(20), nullable=False)
     username: Mapped[str | None] = mapped_column(
         String(100), unique=True, index=True, nullable=True
     )
@@ -99,7 +115,7 @@ class Permission(Base):
 
     __tablename__ = "permissions"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(
         String(100), unique=True, index=True, nullable=False
     )
@@ -130,7 +146,7 @@ class Group(Base):
 
     __tablename__ = "groups"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(
         String(100), unique=True, index=True, nullable=False
     )
@@ -164,7 +180,7 @@ class Profile(Base):
 
     __tablename__ = "profiles"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True
     )
@@ -198,17 +214,38 @@ class OTP(Base):
     """OTP (One-Time Password) model for verification."""
 
     __tablename__ = "otps"
+    __table_args__ = (
+        # At most one active OTP per (email, purpose); also serves the
+        # active OTP lookup in verify_otp
+        Index(
+            "uq_otps_active_email_purpose",
+            "email",
+            "purpose",
+            unique=True,
+            postgresql_where=text("is_used = false"),
+        ),
+        # Partial index matching the phone-based active OTP lookup
+        Index(
+            "ix_otps_phone_purpose_active",
+            "phone",
+            "purpose",
+            text("expires_at DESC"),
+            postgresql_where=text("is_used = false"),
+        ),
+        # Range scans for pruning expired OTPs
+        Index("ix_otps_expires_at", "expires_at"),
+        # User-scoped invalidation and the cascade delete from users
+        Index("ix_otps_user_id", "user_id"),
+    )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int | None] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True
     )
     email: Mapped[str | None] = mapped_column(String(255), nullable=True)
     phone: Mapped[str | None] = mapped_column(String(20), nullable=True)
     code: Mapped[str] = mapped_column(String(10), nullable=False)
-    purpose: Mapped[str] = mapped_column(
-        String(50), nullable=False, index=True
-    )
+    purpose: Mapped[str] = mapped_column(String(50), nullable=False)
     is_used: Mapped[bool] = mapped_column(Boolean, default=False)
     attempts: Mapped[int] = mapped_column(Integer, default=0)
     expires_at: Mapped[datetime] = mapped_column(
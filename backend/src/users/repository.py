@@ -3,10 +3,11 @@
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Row, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from users.models import Group, Permission, Profile, User
+from sqlalchemy.orm.attributes import set_committed_value
+from users.models import LOGIN_COLUMNS, Group, Permission, Profile, User
 
 
 class UserRepository:
@@ -42,7 +43,12 @@ class UserRepository:
         )
         self.session.add(user)
         await self.session.commit()
-        await self.session.refresh(user)
+
+        # Column values are all set by the INSERT (client-side defaults,
+        # RETURNING id); a new user has no groups or profile yet, so mark
+        # them loaded instead of refreshing the row
+        set_committed_value(user, "groups", [])
+        set_committed_value(user, "profile", None)
         return user
 
     async def get_by_id(self, user_id: int) -> User | None:
@@ -123,6 +129,69 @@ class UserRepository:
             return user
         return await self.get_by_phone(login)
 
+    async def get_conflicts(
+        self,
+        email: str,
+        username: str | None = None,
+        phone: str | None = None,
+    ) -> set[str]:
+        """Find which unique identifiers are already registered.
+
+        Checks all given identifiers in a single query.
+
+        Args:
+            email: Email address to check
+            username: Optional username to check
+            phone: Optional phone number to check
+
+        Returns:
+            Names of the taken fields ("email", "username", "phone")
+        """
+        conditions = [User.email == email]
+        if username:
+            conditions.append(User.username == username)
+        if phone:
+            conditions.append(User.phone == phone)
+
+        result = await self.session.execute(
+            select(User.email, User.username, User.phone).where(
+                or_(*conditions)
+            )
+        )
+
+        conflicts: set[str] = set()
+        for row in result:
+            if row.email == email:
+                conflicts.add("email")
+            if username and row.username == username:
+                conflicts.add("username")
+            if phone and row.phone == phone:
+                conflicts.add("phone")
+        return conflicts
+
+    async def get_login_credentials(self, login: str) -> Row[Any] | None:
+        """Get the columns needed to authenticate a login.
+
+        Selects only the columns included in the email and phone indexes,
+        so the lookup can be served by an index-only scan.
+
+        Args:
+            login: Email or phone number
+
+        Returns:
+            Row with id, hashed_password, is_active and is_verified, or
+            None if not found
+        """
+        columns = [getattr(User, name) for name in LOGIN_COLUMNS]
+        for login_column in (User.email, User.phone):
+            result = await self.session.execute(
+                select(*columns).where(login_column == login)
+            )
+            credentials = result.one_or_none()
+            if credentials is not None:
+                return credentials
+        return None
+
     async def update(self, user_id: int, **kwargs: Any) -> User | None:
         """Update user fields.
 
@@ -1,13 +1,37 @@
 """Security utilities for authentication and authorization."""
 
+import base64
+import hashlib
+import hmac
+import secrets
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from jose import JWTError, jwt
+import orjson
+from jose import ExpiredSignatureError, JWSError, JWTError, jwk, jws
+from jose.exceptions import JWTClaimsError
 from passlib.context import CryptContext
 
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
+# Hash of a random, discarded password. Checked when a login names an
+# unknown user, so failed logins cost the same whether or not it exists.
+# A public timing decoy, not a credential.
+DUMMY_PASSWORD_HASH = (
+    "$argon2id$v=19$m=65536,t=3,p=4$MmaMUer9X+uds1ZKKQUg5A"  # nosec B105
+    "$gXCIFFdl63qPc+nM9srnl6n9qftJaKoa/Joafoy/pNE"
+)
+
+# Hashes of recently verified correct passwords, keyed by (stored hash,
+# keyed digest of password). Only successes are kept, so every failed
+# guess still costs a full argon2 check. The per-process key keeps plain
+# password digests out of the cache.
+VERIFY_CACHE_SIZE = 1024
+_verify_cache: OrderedDict[tuple[str, bytes], None] = OrderedDict()
+_verify_cache_key = secrets.token_bytes(32)
+
 
 class PasswordHasher:
     """Password hashing and verification handler."""
@@ -37,6 +61,47 @@ class PasswordHasher:
         """
         return pwd_context.verify(plain_password, hashed_password)
 
+    @staticmethod
+    def verify_password_cached(
+        plain_password: str, hashed_password: str | None
+    ) -> bool:
+        """Verify a password, reusing a recent successful identical check.
+
+        Repeated logins with the correct password against the same hash
+        skip the argon2 computation. Failures are never cached, and a
+        missing hash is checked against ``DUMMY_PASSWORD_HASH`` without
+        the cache, so unknown users always pay for a full verify. A
+        password change produces a new hash and so a new cache key.
+
+        Args:
+            plain_password: Plain text password to verify
+            hashed_password: Hashed password from database, or None if
+                the user does not exist
+
+        Returns:
+            True if password matches, False otherwise
+        """
+        if not hashed_password or hashed_password == DUMMY_PASSWORD_HASH:
+            pwd_context.verify(plain_password, DUMMY_PASSWORD_HASH)
+            return False
+
+        digest = hmac.new(
+            _verify_cache_key, plain_password.encode(), hashlib.sha256
+        ).digest()
+        key = (hashed_password, digest)
+
+        if key in _verify_cache:
+            _verify_cache.move_to_end(key)
+            return True
+
+        if not pwd_context.verify(plain_password, hashed_password):
+            return False
+
+        _verify_cache[key] = None
+        if len(_verify_cache) > VERIFY_CACHE_SIZE:
+            _verify_cache.popitem(last=False)
+        return True
+
 
 class JWTHandler:
     """JWT token creation and validation handler."""
@@ -60,6 +125,9 @@ class JWTHandler:
         self.algorithm = algorithm
         self.access_token_expire_minutes = access_token_expire_minutes
         self.refresh_token_expire_days = refresh_token_expire_days
+        # Build the key object once; passing the raw secret makes jose
+        # re-parse and re-construct it on every encode and decode
+        self._key = jwk.construct(secret_key, algorithm)
 
     def create_access_token(
         self, data: dict[str, Any], expires_delta: timedelta | None = None
@@ -73,22 +141,12 @@ class JWTHandler:
         Returns:
             Encoded JWT token string
         """
-        to_encode = data.copy()
-        if expires_delta:
-            expire = datetime.now(timezone.utc) + expires_delta
-        else:
-            expire = datetime.now(timezone.utc) + timedelta(
-                minutes=self.access_token_expire_minutes
-            )
-
-        to_encode.update(
-            {
-                "exp": expire,
-                "type": "access",
-                "iat": datetime.now(timezone.utc),
-            }
+        now = datetime.now(timezone.utc)
+        expire = now + (
+            expires_delta
+            or timedelta(minutes=self.access_token_expire_minutes)
         )
-        return jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
+        return self._encode(data, "access", expire, now)
 
     def create_refresh_token(
         self, data: dict[str, Any], expires_delta: timedelta | None = None
@@ -102,22 +160,60 @@ class JWTHandler:
         Returns:
             Encoded JWT refresh token string
         """
-        to_encode = data.copy()
-        if expires_delta:
-            expire = datetime.now(timezone.utc) + expires_delta
-        else:
-            expire = datetime.now(timezone.utc) + timedelta(
-                days=self.refresh_token_expire_days
-            )
+        now = datetime.now(timezone.utc)
+        expire = now + (
+            expires_delta or timedelta(days=self.refresh_token_expire_days)
+        )
+        return self._encode(data, "refresh", expire, now)
+
+    def create_token_pair(self, data: dict[str, Any]) -> tuple[str, str]:
+        """Create access and refresh tokens issued at the same instant.
+
+        Args:
+            data: Payload data to encode in both tokens
+
+        Returns:
+            Tuple of (access token, refresh token)
+        """
+        now = datetime.now(timezone.utc)
+        access_expire = now + timedelta(
+            minutes=self.access_token_expire_minutes
+        )
+        refresh_expire = now + timedelta(days=self.refresh_token_expire_days)
+        return (
+            self._encode(data, "access", access_expire, now),
+            self._encode(data, "refresh", refresh_expire, now),
+        )
+
+    def _encode(
+        self,
+        data: dict[str, Any],
+        token_type: str,
+        expire: datetime,
+        issued_at: datetime,
+    ) -> str:
+        """Sign a token with the prepared key.
 
-        to_encode.update(
+        Args:
+            data: Payload data to encode
+            token_type: Token type claim (access or refresh)
+            expire: Expiration time
+            issued_at: Issue time
+
+        Returns:
+            Encoded JWT token string
+        """
+        # jose would serialize the claims with the stdlib json module;
+        # signing pre-encoded orjson bytes yields the same token format
+        claims = orjson.dumps(
             {
-                "exp": expire,
-                "type": "refresh",
-                "iat": datetime.now(timezone.utc),
+                **data,
+                "exp": int(expire.timestamp()),
+                "type": token_type,
+                "iat": int(issued_at.timestamp()),
             }
         )
-        return jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
+        return jws.sign(claims, self._key, algorithm=self.algorithm)
 
     def verify_token(
         self,
@@ -138,11 +234,47 @@ class JWTHandler:
             ValueError: If token type doesn't match expected type
         """
         try:
-            payload = jwt.decode(
-                token, self.secret_key, algorithms=[self.algorithm]
-            )
-            if payload.get("type") != token_type:
-                raise ValueError(f"Invalid token type: expected {token_type}")
-            return payload
-        except JWTError as e:
+            claims = self._unverified_claims(token)
+            # Expired tokens are rejected without any signature work
+            exp = claims.get("exp")
+            if exp is not None:
+                if not isinstance(exp, int):
+                    raise JWTClaimsError(
+                        "Expiration Time claim (exp) must be an integer."
+                    )
+                if exp < time.time():
+                    raise ExpiredSignatureError("Signature has expired.")
+            # The verified payload is the segment parsed above, so the
+            # claims are decoded only once
+            jws.verify(token, self._key, algorithms=[self.algorithm])
+        except (JWSError, JWTError) as e:
             raise JWTError(f"Token verification failed: {str(e)}") from e
+
+        if claims.get("type") != token_type:
+            raise ValueError(f"Invalid token type: expected {token_type}")
+        return claims
+
+    @staticmethod
+    def _unverified_claims(token: str) -> dict[str, Any]:
+        """Decode the claims segment of a token without verifying it.
+
+        Args:
+            token: JWT token string
+
+        Returns:
+            Token claims
+
+        Raises:
+            JWTError: If the claims segment is malformed
+        """
+        try:
+            segment = token.split(".")[1]
+            claims = orjson.loads(
+                base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+            )
+        except (IndexError, ValueError) as e:
+            raise JWTError("Error decoding token claims.") from e
+
+        if not isinstance(claims, dict):
+            raise JWTError("Invalid payload string: must be a json object")
+        return claims
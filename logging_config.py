@@ -1,12 +1,41 @@
 """Centralized logging configuration for all modules."""
 
-import json
+import atexit
+import copy
 import logging
+import logging.handlers
 import os
+import queue
 import sys
-from datetime import datetime
+import threading
+from collections.abc import Sequence
+from datetime import datetime, timezone
 from typing import Any
 
+import orjson
+
+_CUSTOM_FIELDS = (
+    "user_id",
+    "request_id",
+    "duration_ms",
+    "environment",
+    "chroma_mode",
+)
+
+
+class StructuredLogRecord(logging.LogRecord):
+    """Log record with every custom field defaulting to ``None``.
+
+    The defaults are class attributes, so records without the fields
+    cost nothing extra and ``extra=`` can still set them per call.
+    """
+
+    user_id: Any = None
+    request_id: Any = None
+    duration_ms: Any = None
+    environment: Any = None
+    chroma_mode: Any = None
+
 
 class JSONFormatter(logging.Formatter):
     """JSON log formatter for structured logging."""
@@ -21,8 +50,28 @@ class JSONFormatter(logging.Formatter):
             JSON-formatted log string
 
         """
+        return self.format_line(record)[:-1].decode()
+
+    def format_line(self, record: logging.LogRecord) -> bytes:
+        """Format log record as a newline-terminated UTF-8 JSON line.
+
+        Args:
+            record: Log record to format
+
+        Returns:
+            Encoded JSON line, ready to write to a binary stream
+        """
+        # A record propagating to several handlers is serialized once
+        cached = record.__dict__.get("_json_cached")
+        if cached is not None:
+            return cached
+
         log_data: dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            # Event time, not format time: records may be formatted later
+            # on a listener thread
+            "timestamp": datetime.fromtimestamp(
+                record.created, tz=timezone.utc
+            ),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -30,27 +79,212 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        for field in (
-            "user_id",
-            "request_id",
-            "duration_ms",
-            "environment",
-            "chroma_mode",
-        ):
-            if hasattr(record, field):
-                log_data[field] = getattr(record, field)
+        # Defaults to None also covers records from other factories
+        for field in _CUSTOM_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                log_data[field] = value
+
+        # orjson renders the aware timestamp as ISO 8601 with a "Z" suffix
+        # and appends the newline itself
+        line = orjson.dumps(
+            log_data, option=orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE
+        )
+        record._json_cached = line
+        return line
+
+
+class StdoutHandler(logging.StreamHandler):
+    """Stream handler that writes to the current ``sys.stdout``.
+
+    Records are written from the listener thread, possibly after
+    ``sys.stdout`` was replaced (e.g. by test output capture), so the
+    stream is looked up on every write like ``logging.lastResort`` does.
+    """
+
+    def __init__(self) -> None:
+        """Initialize handler without binding a stream."""
+        logging.Handler.__init__(self)
+
+    @property  # type: ignore[override]
+    def stream(self) -> Any:
+        """Return the current standard output."""
+        return sys.stdout
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a single record.
+
+        Args:
+            record: Log record to write
+        """
+        try:
+            self.write_records((record,))
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def write_records(self, records: Sequence[logging.LogRecord]) -> None:
+        """Write records to standard output with a single write call.
+
+        JSON lines go straight to the binary buffer when there is one,
+        skipping the decode and re-encode through the text layer.
+
+        Args:
+            records: Log records to write
+        """
+        stream = self.stream
+        buffer = getattr(stream, "buffer", None)
+        formatter = self.formatter
+        if buffer is not None and isinstance(formatter, JSONFormatter):
+            # Pending text (e.g. from print) must go out first
+            stream.flush()
+            buffer.write(b"".join(map(formatter.format_line, records)))
+            buffer.flush()
+        else:
+            stream.write(
+                "".join(
+                    self.format(record) + self.terminator for record in records
+                )
+            )
+            stream.flush()
+
+
+class BatchedStreamHandler(logging.handlers.MemoryHandler):
+    """Buffer records and write each batch to a stream in one call.
+
+    Besides the capacity and level triggers, a background thread flushes
+    every ``flush_interval`` seconds, so records on a quiet service are
+    not held in memory indefinitely.
+    """
+
+    def __init__(
+        self,
+        stream_handler: StdoutHandler,
+        capacity: int,
+        flush_interval: float = 1.0,
+    ) -> None:
+        """Initialize batched handler.
+
+        Args:
+            stream_handler: Handler that formats and writes the batches
+            capacity: Records buffered before a flush
+            flush_interval: Longest time in seconds a record stays
+                buffered
+        """
+        super().__init__(
+            capacity,
+            flushLevel=logging.ERROR,
+            target=stream_handler,
+            flushOnClose=True,
+        )
+        self._stream_handler = stream_handler
+        self.flush_interval = flush_interval
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="log-flush", daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_periodically(self) -> None:
+        """Flush the buffer on a timer until the handler is closed."""
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered records with a single stream write."""
+        with self.lock:
+            if not self.buffer:
+                return
+            try:
+                self._stream_handler.write_records(self.buffer)
+            except Exception:
+                self.handleError(self.buffer[-1])
+            self.buffer.clear()
+
+    def close(self) -> None:
+        """Stop the flush timer, then flush and close the handler."""
+        self._closed.set()
+        self._flusher.join()
+        super().close()
+
+
+class RecordQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves all formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge message arguments and keep the record otherwise intact.
+
+        The stock implementation formats the record and drops
+        ``exc_info``, which would move formatting back onto the calling
+        thread and fold tracebacks into the message.
+
+        Args:
+            record: Log record to enqueue
+
+        Returns:
+            Copy of the record with its message arguments merged
+        """
+        # Arguments are merged now because they may change after the
+        # logging call returns
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_listener: logging.handlers.QueueListener | None = None
+_log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+_setup_args: tuple[str, str] = ("INFO", "json")
+
+
+def stop_logging() -> None:
+    """Stop the logging listener after writing all queued records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        # Ends buffering handlers' flush timers and writes what is left
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(stop_logging)
 
-        return json.dumps(log_data)
+
+def queue_handler() -> logging.Handler:
+    """Create a handler for the shared logging queue.
+
+    Factory for logging configs applied with ``dictConfig`` (e.g.
+    uvicorn's): ``dictConfig`` closes every existing handler first, so
+    the listener is restarted with the last ``setup_logging`` settings
+    before the handler is returned. Records logged through it are
+    formatted and written on the listener thread.
+
+    Returns:
+        Queue handler feeding the running listener
+    """
+    setup_logging(*_setup_args)
+    return RecordQueueHandler(_log_queue)
 
 
 def setup_logging(level: str = "INFO", format_type: str = "json") -> None:
     """Setup centralized logging for entire project.
 
+    Records are put on a queue and formatted and written by a listener
+    thread, so logging calls do not serialize JSON or block on stdout.
+    Set ``LOG_BUFFER_CAPACITY`` to buffer up to that many records before
+    writing them, for at most ``LOG_FLUSH_INTERVAL_MS`` milliseconds;
+    buffering is off by default so logs appear immediately.
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         format_type: Format type (json or text)
     """
+    global _listener, _log_queue, _setup_args
+    _setup_args = (level, format_type)
     log_level = os.getenv("LOG_LEVEL", level).upper()
+    logging.setLogRecordFactory(StructuredLogRecord)
 
     formatter: logging.Formatter
     if format_type == "json":
@@ -60,10 +294,28 @@ def setup_logging(level: str = "INFO", format_type: str = "json") -> None:
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
+    stream_handler = StdoutHandler()
+    stream_handler.setFormatter(formatter)
+
+    # Optionally batch records so bursts cost one write per flush instead
+    # of one per record. Errors flush immediately, quiet periods flush on
+    # a timer, and logging's atexit shutdown flushes the rest.
+    handler: logging.Handler = stream_handler
+    buffer_capacity = int(os.getenv("LOG_BUFFER_CAPACITY", "0"))
+    if buffer_capacity > 0:
+        flush_interval_ms = int(os.getenv("LOG_FLUSH_INTERVAL_MS", "1000"))
+        handler = BatchedStreamHandler(
+            stream_handler, buffer_capacity, flush_interval_ms / 1000
+        )
+
+    stop_logging()
+    _log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(
+        _log_queue, handler, respect_handler_level=True
+    )
+    _listener.start()
 
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level))
     root_logger.handlers.clear()
-    root_logger.addHandler(handler)
+    root_logger.addHandler(RecordQueueHandler(_log_queue))
@@ -0,0 +1,43 @@
+"""Add indexes for keyset pagination of articles.
+
+Revision ID: 78894f28a688
+Revises: bd2ccbb007b5
+Create Date: 2026-10-16 20:45:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "78894f28a688"
+down_revision: Union[str, Sequence[str], None] = "bd2ccbb007b5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, columns) - match ORDER BY date DESC NULLS LAST, id DESC
+KEYSET_INDEXES: tuple[tuple[str, str], ...] = (
+    ("ix_article_date_id", "date DESC NULLS LAST, id DESC"),
+    (
+        "ix_article_category_date_id",
+        "category, date DESC NULLS LAST, id DESC",
+    ),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, columns in KEYSET_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON news_articles ({columns})"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(KEYSET_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,43 @@
+"""Add trigram indexes for admin text filters.
+
+Revision ID: bd2ccbb007b5
+Revises: 0db51def8e7c
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "bd2ccbb007b5"
+down_revision: Union[str, Sequence[str], None] = "0db51def8e7c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, column) - GIN trigram indexes serving ILIKE '%...%'
+TRIGRAM_INDEXES: tuple[tuple[str, str, str], ...] = (
+    ("ix_article_category_trgm", "news_articles", "category"),
+    ("ix_entity_text_trgm", "entities", "text"),
+    ("ix_keyword_value_trgm", "keywords", "value"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        for name, table, column in TRIGRAM_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING gin ({column} gin_trgm_ops)"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, *_ in reversed(TRIGRAM_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -3,6 +3,7 @@
 from datetime import datetime
 
 from sqlalchemy import (
+    DDL,
     BigInteger,
     Boolean,
     DateTime,
@@ -13,15 +14,32 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    event,
     func,
 )
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    column_property,
+    mapped_column,
+    relationship,
+)
 
 
 class Base(DeclarativeBase):
     """Base declarative class."""
 
 
+# Trigram indexes below need pg_trgm when tables are created via create_all
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(
+        dialect="postgresql"
+    ),
+)
+
+
 class Source(Base):
     """News source such as Telegram channel."""
 
@@ -52,6 +70,13 @@ class Article(Base):
         # Essential indexes for common queries
         Index("ix_article_date", "date"),
         Index("ix_article_category", "category"),
+        # Trigram index for substring (ILIKE) filters
+        Index(
+            "ix_article_category_trgm",
+            "category",
+            postgresql_using="gin",
+            postgresql_ops={"category": "gin_trgm_ops"},
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -86,6 +111,10 @@ class Article(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+    # Server-side truncation of full_content, loaded only when undeferred
+    content_preview: Mapped[str | None] = column_property(
+        func.substr(full_content, 1, 200), deferred=True
+    )
 
     source: Mapped[Source] = relationship(back_populates="articles")
     chunks: Mapped[list["Chunk"]] = relationship(
@@ -105,6 +134,21 @@ class Article(Base):
     )
 
 
+# Keyset pagination walks articles by (date DESC NULLS LAST, id DESC);
+# the indexes match that order, with and without a category filter
+Index(
+    "ix_article_date_id",
+    Article.date.desc().nulls_last(),
+    Article.id.desc(),
+)
+Index(
+    "ix_article_category_date_id",
+    Article.category,
+    Article.date.desc().nulls_last(),
+    Article.id.desc(),
+)
+
+
 class Chunk(Base):
     """Chunk of article used for vector store."""
 
@@ -151,6 +195,15 @@ class Keyword(Base):
     """Keyword taxonomy item."""
 
     __tablename__ = "keywords"
+    __table_args__ = (
+        # Trigram index for substring (ILIKE) filters
+        Index(
+            "ix_keyword_value_trgm",
+            "value",
+            postgresql_using="gin",
+            postgresql_ops={"value": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     value: Mapped[str] = mapped_column(String(128), unique=True)
@@ -171,6 +224,13 @@ class Entity(Base):
             "role",
             name="uq_entity_identity",
         ),
+        # Trigram index for substring (ILIKE) filters
+        Index(
+            "ix_entity_text_trgm",
+            "text",
+            postgresql_using="gin",
+            postgresql_ops={"text": "gin_trgm_ops"},
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -4,16 +4,20 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from datetime import datetime
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from rag_module.data_processing.protocols import Document
-
 from .models import Article, Chunk, Entity, Keyword, Source, Subcategory, Topic
 
+if TYPE_CHECKING:
+    # Only used in annotations; importing it at runtime would pull the
+    # whole data_processing package (and langchain) into anything that
+    # touches the models
+    from rag_module.data_processing.protocols import Document
+
 
 def normalize_text(value: str | None) -> str:
     """Normalize text for consistent storage: lowercase and strip whitespace."""
@@ -0,0 +1,77 @@
+"""Tests for the SQLAdmin authentication backend."""
+
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from auth.services import admin_auth_service
+from auth.services.admin_auth_service import (
+    ADMIN_CLAIM_KEY,
+    ADMIN_CLAIM_TTL_SECONDS,
+    AdminAuthBackend,
+)
+
+
+def make_db(row) -> tuple[Mock, Mock]:
+    """Create a mock database manager whose lookup returns row."""
+    session = Mock()
+    result = Mock()
+    result.one_or_none.return_value = row
+    session.execute = AsyncMock(return_value=result)
+
+    async def get_session():
+        yield session
+
+    manager = Mock()
+    manager.get_session = get_session
+    return manager, session
+
+
+@pytest.fixture
+def backend():
+    """Create admin auth backend."""
+    return AdminAuthBackend(secret_key="secret")
+
+
+class TestAuthenticate:
+    """Tests for AdminAuthBackend.authenticate."""
+
+    async def test_fresh_claim_skips_database(self, backend):
+        """Test an unexpired session claim is trusted without a query."""
+        manager, session = make_db(None)
+        request = Mock(
+            session={"user_id": 1, ADMIN_CLAIM_KEY: time.time() + 10}
+        )
+
+        with patch.object(
+            admin_auth_service, "get_db_manager", return_value=manager
+        ):
+            assert await backend.authenticate(request)
+
+        session.execute.assert_not_awaited()
+
+    async def test_expired_claim_rejects_demoted_user(self, backend):
+        """Test the flags are re-read once the claim expires."""
+        manager, session = make_db(Mock(is_superuser=False, is_active=True))
+        request = Mock(session={"user_id": 1, ADMIN_CLAIM_KEY: 0})
+
+        with patch.object(
+            admin_auth_service, "get_db_manager", return_value=manager
+        ):
+            assert not await backend.authenticate(request)
+
+        session.execute.assert_awaited_once()
+        assert request.session == {}
+
+    async def test_expired_claim_is_renewed_for_admin(self, backend):
+        """Test a still-valid superuser gets a new short-lived claim."""
+        manager, _ = make_db(Mock(is_superuser=True, is_active=True))
+        request = Mock(session={"user_id": 1, ADMIN_CLAIM_KEY: 0})
+
+        with patch.object(
+            admin_auth_service, "get_db_manager", return_value=manager
+        ):
+            assert await backend.authenticate(request)
+
+        remaining = request.session[ADMIN_CLAIM_KEY] - time.time()
+        assert 0 < remaining <= ADMIN_CLAIM_TTL_SECONDS
@@ -0,0 +1,41 @@
+"""Tests for authentication service."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from auth.services.auth_service import AuthService
+from fastapi import HTTPException
+from users import security
+from users.security import DUMMY_PASSWORD_HASH, PasswordHasher
+
+
+@pytest.fixture
+def auth_service():
+    """Create auth service whose user lookup finds nobody."""
+    service = AuthService(
+        session=Mock(), jwt_handler=Mock(), password_hasher=PasswordHasher()
+    )
+    service.user_repo.get_login_credentials = AsyncMock(return_value=None)
+    return service
+
+
+class TestAuthenticateUser:
+    """Tests for AuthService.authenticate_user."""
+
+    async def test_unknown_user_runs_argon2_on_every_attempt(
+        self, auth_service
+    ):
+        """Test repeat logins for a missing user are never cache hits."""
+        security._verify_cache.clear()
+        with patch.object(
+            security.pwd_context, "verify", return_value=True
+        ) as verify:
+            for _ in range(3):
+                with pytest.raises(HTTPException) as exc_info:
+                    await auth_service.authenticate_user("a@b.c", "secret")
+                assert exc_info.value.status_code == 401
+
+        assert verify.call_count == 3
+        for call in verify.call_args_list:
+            assert call.args == ("secret", DUMMY_PASSWORD_HASH)
+        assert not security._verify_cache
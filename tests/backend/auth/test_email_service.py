@@ -0,0 +1,155 @@
+"""Tests for email service."""
+
+import smtplib
+import socket
+import threading
+from unittest.mock import Mock
+
+import pytest
+from auth.services.email_service import SMTP_POOL_SIZE, SMTPEmailSender
+
+
+@pytest.fixture
+def sender():
+    """Create SMTP sender with a mocked connection factory."""
+    sender = SMTPEmailSender(
+        smtp_host="smtp.example.com",
+        smtp_port=587,
+        smtp_user="user",
+        smtp_password="secret",
+        from_email="noreply@example.com",
+    )
+    sender._connect = Mock()
+    return sender
+
+
+def make_server(*errors: Exception | None) -> Mock:
+    """Create mock SMTP server raising the given errors in order."""
+    server = Mock()
+    server.sendmail.side_effect = list(errors)
+    return server
+
+
+class TestSendRaw:
+    """Tests for SMTPEmailSender._send_raw."""
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            smtplib.SMTPServerDisconnected("gone"),
+            ConnectionResetError(),
+            socket.timeout(),
+        ],
+    )
+    def test_dropped_connection_is_retried(self, sender, error):
+        """Test connection-level failures reconnect and resend once."""
+        first, second = make_server(error), make_server(None)
+        sender._connect.side_effect = [first, second]
+
+        sender._send_raw("a@b.c", b"raw")
+
+        first.close.assert_called_once()
+        second.sendmail.assert_called_once()
+        assert sender._idle == [second]
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            smtplib.SMTPRecipientsRefused({"a@b.c": (550, b"no")}),
+            smtplib.SMTPDataError(554, b"rejected"),
+            smtplib.SMTPSenderRefused(553, b"no", "noreply@example.com"),
+        ],
+    )
+    def test_server_errors_are_not_resent(self, sender, error):
+        """Test SMTP errors drop the connection without a resend."""
+        server = make_server(error)
+        sender._connect.side_effect = [server]
+
+        with pytest.raises(type(error)):
+            sender._send_raw("a@b.c", b"raw")
+
+        server.sendmail.assert_called_once()
+        server.close.assert_called_once()
+        assert sender._connect.call_count == 1
+        assert sender._idle == []
+
+    def test_second_dropped_connection_is_raised(self, sender):
+        """Test a retry that fails again gives up."""
+        sender._connect.side_effect = [
+            make_server(ConnectionResetError()),
+            make_server(ConnectionResetError()),
+        ]
+
+        with pytest.raises(ConnectionResetError):
+            sender._send_raw("a@b.c", b"raw")
+
+        assert sender._idle == []
+
+    def test_idle_connection_is_reused(self, sender):
+        """Test a healthy connection goes back to the pool for reuse."""
+        server = make_server(None, None)
+        sender._connect.side_effect = [server]
+
+        sender._send_raw("a@b.c", b"raw")
+        sender._send_raw("d@e.f", b"raw")
+
+        assert sender._connect.call_count == 1
+        assert server.sendmail.call_count == 2
+        assert sender._idle == [server]
+
+
+class TestSendEmail:
+    """Tests for SMTPEmailSender.send_email."""
+
+    async def test_sends_on_dedicated_executor(self, sender):
+        """Test sends run on the bounded SMTP pool, not to_thread."""
+        thread_names = []
+        sender._send_sync = Mock(
+            side_effect=lambda *args: thread_names.append(
+                threading.current_thread().name
+            )
+        )
+
+        assert await sender.send_email("a@b.c", "Subject", "Body")
+
+        assert thread_names[0].startswith("smtp")
+        assert sender._executor._max_workers == SMTP_POOL_SIZE
+
+
+class TestSendTemplatedSync:
+    """Tests for SMTPEmailSender._send_templated_sync."""
+
+    BODY = "<p>Code: __CODE__</p>"
+
+    @pytest.fixture
+    def sender(self, sender):
+        """Create sender recording both send paths."""
+        sender._send_raw = Mock()
+        sender._send_sync = Mock()
+        return sender
+
+    def test_plain_address_uses_cached_bytes(self, sender):
+        """Test a bare address is spliced into the cached message."""
+        sender._send_templated_sync(
+            "a@b.c", "Subject", self.BODY, {"__CODE__": "123456"}, True
+        )
+
+        sender._send_sync.assert_not_called()
+        to_email, raw = sender._send_raw.call_args.args
+        assert to_email == "a@b.c"
+        assert b"To: a@b.c\n" in raw
+        assert b"123456" in raw
+
+    @pytest.mark.parametrize(
+        "to_email", ["a,b@c.d", '"x"<y>@c.d', "a;b@c.d", "x (y)@c.d"]
+    )
+    def test_non_plain_address_takes_regular_path(self, sender, to_email):
+        """Test recipients that could split the To header are not spliced."""
+        sender._send_templated_sync(
+            to_email, "Subject", self.BODY, {"__CODE__": "123456"}, True
+        )
+
+        sender._send_raw.assert_not_called()
+        sender._send_sync.assert_called_once_with(
+            to_email, "Subject", "<p>Code: 123456</p>", True
+        )
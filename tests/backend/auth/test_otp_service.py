@@ -0,0 +1,57 @@
+"""Tests for OTP service."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from auth.services.otp_service import OTPService
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import Insert
+
+
+def compile_sql(stmt) -> str:
+    """Compile a statement for PostgreSQL."""
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def mock_session():
+    """Create mock async session recording executed statements."""
+    session = Mock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    result = Mock()
+    result.one.return_value = Mock(code="123456")
+    session.scalars = AsyncMock(return_value=result)
+    return session
+
+
+@pytest.fixture
+def otp_service(mock_session):
+    """Create OTP service over the mock session."""
+    return OTPService(session=mock_session, email_sender=Mock())
+
+
+class TestCreateOTP:
+    """Tests for OTPService.create_otp."""
+
+    async def test_insert_rotates_active_otp_on_conflict(
+        self, otp_service, mock_session
+    ):
+        """Test insert upserts into the active (email, purpose) OTP."""
+        await otp_service.create_otp(purpose="registration", email="a@b.c")
+
+        stmt = mock_session.scalars.await_args.args[0]
+        assert isinstance(stmt, Insert)
+        sql = compile_sql(stmt)
+        assert (
+            "ON CONFLICT (email, purpose) WHERE is_used = false DO UPDATE"
+            in sql
+        )
+        for column in ("code", "expires_at", "attempts", "user_id"):
+            assert f"{column} = " in sql.split("DO UPDATE SET", 1)[1]
+        assert "RETURNING" in sql
+
+    async def test_requires_email_or_phone(self, otp_service):
+        """Test creating an OTP without a recipient fails."""
+        with pytest.raises(ValueError):
+            await otp_service.create_otp(purpose="registration")
@@ -0,0 +1,63 @@
+"""Tests for password hashing helpers."""
+
+from unittest.mock import patch
+
+import pytest
+from users import security
+from users.security import DUMMY_PASSWORD_HASH, PasswordHasher
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start every test with an empty verification cache."""
+    security._verify_cache.clear()
+    yield
+    security._verify_cache.clear()
+
+
+@pytest.fixture
+def verify():
+    """Patch the argon2 verify call, matching only 'correct'."""
+    with patch.object(
+        security.pwd_context,
+        "verify",
+        side_effect=lambda password, _hash: password == "correct",
+    ) as mock:
+        yield mock
+
+
+class TestVerifyPasswordCached:
+    """Tests for PasswordHasher.verify_password_cached."""
+
+    def test_success_is_cached(self, verify):
+        """Test a repeated correct password skips argon2."""
+        assert PasswordHasher.verify_password_cached("correct", "$argon2$a")
+        assert PasswordHasher.verify_password_cached("correct", "$argon2$a")
+
+        assert verify.call_count == 1
+
+    def test_failure_is_not_cached(self, verify):
+        """Test every wrong guess runs argon2."""
+        assert not PasswordHasher.verify_password_cached("wrong", "$argon2$a")
+        assert not PasswordHasher.verify_password_cached("wrong", "$argon2$a")
+
+        assert verify.call_count == 2
+        assert not security._verify_cache
+
+    @pytest.mark.parametrize("hashed", [None, "", DUMMY_PASSWORD_HASH])
+    def test_unknown_user_always_runs_argon2(self, verify, hashed):
+        """Test a repeat attempt against a missing hash is never cached."""
+        for _ in range(3):
+            assert not PasswordHasher.verify_password_cached("correct", hashed)
+
+        assert verify.call_count == 3
+        for call in verify.call_args_list:
+            assert call.args[1] == DUMMY_PASSWORD_HASH
+        assert not security._verify_cache
+
+    def test_new_hash_is_verified_again(self, verify):
+        """Test a changed password hash misses the cache."""
+        PasswordHasher.verify_password_cached("correct", "$argon2$a")
+        PasswordHasher.verify_password_cached("correct", "$argon2$b")
+
+        assert verify.call_count == 2
@@ -0,0 +1,9 @@
+"""Pytest configuration for backend tests."""
+
+import sys
+from pathlib import Path
+
+# The backend imports its modules flat from backend/src
+BACKEND_SRC = Path(__file__).resolve().parents[2] / "backend" / "src"
+if str(BACKEND_SRC) not in sys.path:
+    sys.path.insert(0, str(BACKEND_SRC))
@@ -0,0 +1,47 @@
+"""Tests for category service."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+
+from news.services.category import CategoryService
+
+UPDATED_AT = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def make_session(last_update: datetime | None, total: int) -> Mock:
+    """Create mock session answering the epoch query."""
+    result = Mock()
+    result.one.return_value = (last_update, total)
+    session = Mock()
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+class TestGetIngestEpoch:
+    """Tests for CategoryService.get_ingest_epoch."""
+
+    async def test_changes_when_an_article_is_updated(self):
+        """Test an in-place update moves the epoch."""
+        service = CategoryService()
+
+        before = await service.get_ingest_epoch(make_session(UPDATED_AT, 3))
+        after = await service.get_ingest_epoch(
+            make_session(UPDATED_AT + timedelta(seconds=1), 3)
+        )
+
+        assert before != after
+
+    async def test_changes_when_an_article_is_deleted(self):
+        """Test a delete moves the epoch even if updated_at does not."""
+        service = CategoryService()
+
+        before = await service.get_ingest_epoch(make_session(UPDATED_AT, 3))
+        after = await service.get_ingest_epoch(make_session(UPDATED_AT, 2))
+
+        assert before != after
+
+    async def test_empty_table(self):
+        """Test an empty table has a stable epoch."""
+        epoch = await CategoryService().get_ingest_epoch(make_session(None, 0))
+
+        assert epoch == "0-0"
@@ -0,0 +1,99 @@
+"""Tests for news list service."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from news.services.news_list import NewsListService
+from sqlalchemy.dialects import postgresql
+
+AFTER_DATE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def compile_sql(stmt) -> str:
+    """Compile a statement for PostgreSQL."""
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def make_session(*pages: list[int]) -> Mock:
+    """Create mock session returning one page of article ids per query."""
+    session = Mock()
+    results = []
+    for page in pages:
+        result = Mock()
+        result.scalars.return_value = iter(page)
+        results.append(result)
+    session.execute = AsyncMock(side_effect=results)
+    return session
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """Create news list service serializing articles as themselves."""
+    service = NewsListService()
+    monkeypatch.setattr(service, "_serialize_article", lambda article: article)
+    return service
+
+
+def executed_sql(session: Mock) -> list[str]:
+    """Return compiled SQL of every executed statement."""
+    return [compile_sql(c.args[0]) for c in session.execute.await_args_list]
+
+
+class TestGetNewsListKeyset:
+    """Tests for NewsListService.get_news_list_keyset."""
+
+    async def test_dated_cursor_seeks_with_row_comparison(self, service):
+        """Test a dated cursor is a single seek predicate without OR."""
+        session = make_session([5, 4, 3])
+
+        news = await service.get_news_list_keyset(
+            session, limit=3, after=(AFTER_DATE, 6)
+        )
+
+        assert news == [5, 4, 3]
+        [sql] = executed_sql(session)
+        assert (
+            "(news_articles.date, news_articles.id) < "
+            "(%(param_1)s, %(param_2)s)" in sql
+        )
+        assert "news_articles.date IS NOT NULL" in sql
+        assert " OR " not in sql
+        assert (
+            "ORDER BY news_articles.date DESC NULLS LAST, "
+            "news_articles.id DESC" in sql
+        )
+
+    async def test_short_dated_page_is_topped_up_with_undated(self, service):
+        """Test undated articles fill the rest of a short page."""
+        session = make_session([5], [9, 8])
+
+        news = await service.get_news_list_keyset(
+            session, limit=3, after=(AFTER_DATE, 6)
+        )
+
+        assert news == [5, 9, 8]
+        dated_sql, undated_sql = executed_sql(session)
+        assert "news_articles.date IS NULL" in undated_sql
+        assert "ORDER BY news_articles.id DESC" in undated_sql
+        assert " OR " not in undated_sql
+        undated = session.execute.await_args_list[1].args[0]
+        assert "LIMIT 2" in str(
+            undated.compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+
+    async def test_undated_cursor_only_reads_undated(self, service):
+        """Test an undated cursor skips the dated query."""
+        session = make_session([4, 3])
+
+        news = await service.get_news_list_keyset(
+            session, limit=3, after=(None, 5)
+        )
+
+        assert news == [4, 3]
+        [sql] = executed_sql(session)
+        assert "news_articles.date IS NULL" in sql
+        assert "news_articles.id < %(id_1)s" in sql
@@ -0,0 +1,182 @@
+"""Tests for news router."""
+
+from unittest.mock import AsyncMock, Mock
+from urllib.parse import parse_qs, urlsplit
+
+import orjson
+import pytest
+from database import get_db_session
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from news import router as news_router
+from news.dependencies import get_postgres_service
+from news.schemas import NewsListResponse
+from users.dependencies import get_current_superuser
+
+
+@pytest.fixture
+def service():
+    """Create mock PostgreSQL news service."""
+    service = Mock()
+    service.get_ingest_epoch = AsyncMock(return_value="1a-3")
+    service.get_categories_with_count = AsyncMock(
+        return_value=[{"category": "politics", "count": 3}]
+    )
+    service.get_category_tree = AsyncMock(
+        return_value={"categories": [], "total_news": 0}
+    )
+    return service
+
+
+@pytest.fixture
+def client(service):
+    """Create test client over the news router with mocked dependencies."""
+
+    async def session():
+        yield None
+
+    app = FastAPI()
+    app.include_router(news_router.router)
+    app.dependency_overrides[get_postgres_service] = lambda: service
+    app.dependency_overrides[get_db_session] = session
+    app.dependency_overrides[get_current_superuser] = lambda: Mock(id=1)
+
+    news_router._news_cache.clear()
+    news_router._epoch_cache.clear()
+    yield TestClient(app)
+    news_router._news_cache.clear()
+    news_router._epoch_cache.clear()
+
+
+@pytest.mark.parametrize("path", ["/news/categories", "/news/category-tree"])
+class TestAggregateETags:
+    """Tests for ETag revalidation of the aggregate endpoints."""
+
+    def test_matching_etag_is_not_modified(self, client, path):
+        """Test a matching If-None-Match gets an empty 304."""
+        etag = client.get(path).headers["etag"]
+
+        response = client.get(path, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_epoch_change_invalidates_etag(self, client, service, path):
+        """Test an updated epoch yields a fresh response."""
+        etag = client.get(path).headers["etag"]
+        service.get_ingest_epoch.return_value = "1b-3"
+        news_router._epoch_cache.clear()
+
+        response = client.get(path, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_etag_comes_from_shared_epoch(self, client, path):
+        """Test the ETag is the database epoch alone, equal on all workers."""
+        response = client.get(path)
+
+        assert response.headers["etag"] == 'W/"1a-3"'
+
+    def test_clearing_cache_rereads_epoch(self, client, service, path):
+        """Test DELETE /news/cache picks up a new epoch immediately."""
+        etag = client.get(path).headers["etag"]
+        service.get_ingest_epoch.return_value = "1b-3"
+
+        assert client.delete("/news/cache").status_code == 204
+        response = client.get(path, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_clearing_cache_keeps_etag_of_unchanged_data(self, client, path):
+        """Test a cache clear alone does not invalidate client copies."""
+        etag = client.get(path).headers["etag"]
+
+        assert client.delete("/news/cache").status_code == 204
+        response = client.get(path, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+
+
+def make_article(article_id: int, total_count: int = 5) -> dict:
+    """Create a serialized article row as returned by the service."""
+    return {
+        "id": article_id,
+        "full_content": f"content {article_id}",
+        "short_preview": None,
+        "category": "politics",
+        "date": "2025-01-01T00:00:00",
+        "importance": 5,
+        "total_count": total_count,
+    }
+
+
+class TestNewsList:
+    """Tests for the paginated news list."""
+
+    @pytest.fixture
+    def service(self, service):
+        """Add five articles served two per page."""
+        service.get_news_list = AsyncMock(
+            return_value=[make_article(5), make_article(4), make_article(3)]
+        )
+        service.get_news_list_keyset = AsyncMock(
+            return_value=[make_article(3), make_article(2), make_article(1)]
+        )
+        service.get_total_count = AsyncMock(return_value=5)
+        return service
+
+    def test_first_page_links_to_cursor(self, client):
+        """Test the first page counts all rows and links forward."""
+        response = client.get("/news/", params={"page_size": 2})
+
+        body = NewsListResponse.model_validate(response.json())
+        assert body.count == 5
+        assert body.previous is None
+        params = parse_qs(urlsplit(body.next).query)
+        assert params["page"] == ["2"]
+        assert "cursor" in params
+
+    def test_cursor_page_keeps_count_and_previous(self, client, service):
+        """Test a page reached through next has the full response shape."""
+        next_url = client.get("/news/", params={"page_size": 2}).json()["next"]
+
+        response = client.get(next_url)
+
+        assert response.status_code == 200
+        body = NewsListResponse.model_validate(response.json())
+        assert body.count == 5
+        assert [item.id for item in body.results.news] == ["3", "2"]
+        previous = parse_qs(urlsplit(body.previous).query)
+        assert previous["page"] == ["1"]
+        assert "cursor" not in previous
+        assert parse_qs(urlsplit(body.next).query)["page"] == ["3"]
+        service.get_total_count.assert_awaited_once()
+
+
+class TestNewsGraph:
+    """Tests for the news graph endpoint."""
+
+    def test_large_graph_is_sent_in_one_body(self, client, service):
+        """Test a large graph round-trips with a Content-Length."""
+        graph = {
+            "nodes": [
+                {"id": f"news-{i}", "kind": "news", "title": "t"}
+                for i in range(150)
+            ],
+            "edges": [
+                {"id": f"edge-{i}", "from": "news-0", "to": f"news-{i}"}
+                for i in range(1, 400)
+            ],
+            "total_news": 150,
+            "total_entities": 12,
+        }
+        service.get_graph_data = AsyncMock(return_value=graph)
+
+        response = client.get("/news/graph", params={"limit": 100})
+
+        assert response.status_code == 200
+        assert int(response.headers["content-length"]) == len(response.content)
+        assert orjson.loads(response.content) == graph
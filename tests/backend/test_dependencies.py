@@ -0,0 +1,54 @@
+"""Tests for shared dependency injection."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from dependencies import ServiceContainer
+
+
+class TestServiceContainer:
+    """Tests for ServiceContainer."""
+
+    def test_vector_store_is_built_once_across_threads(self):
+        """Test concurrent first accesses share one vector store."""
+        container = ServiceContainer()
+        threads_count = 8
+        barrier = threading.Barrier(threads_count)
+        results = []
+
+        def slow_build():
+            time.sleep(0.05)
+            return Mock()
+
+        def access():
+            barrier.wait()
+            results.append(container.vector_store)
+
+        with patch.object(
+            ServiceContainer, "_build_vector_store", side_effect=slow_build
+        ) as build:
+            threads = [
+                threading.Thread(target=access) for _ in range(threads_count)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        build.assert_called_once()
+        assert len(results) == threads_count
+        assert all(store is results[0] for store in results)
+
+    def test_cleanup_allows_rebuild(self):
+        """Test the store is built again after cleanup."""
+        container = ServiceContainer()
+        with patch.object(
+            ServiceContainer, "_build_vector_store", side_effect=Mock
+        ) as build:
+            first = container.vector_store
+            container.cleanup()
+            second = container.vector_store
+
+        assert build.call_count == 2
+        assert first is not second
@@ -0,0 +1,61 @@
+"""Tests for the uvicorn logging configuration."""
+
+import logging
+import logging.config
+import threading
+
+import pytest
+from fastapi_logging_config import UVICORN_LOG_CONFIG
+
+import logging_config
+from logging_config import RecordQueueHandler, StdoutHandler
+
+
+@pytest.fixture
+def applied_config():
+    """Apply the uvicorn config and tear the logging pipeline down after."""
+    root_logger = logging.getLogger()
+    saved_handlers = root_logger.handlers[:]
+    saved_level = root_logger.level
+    logging.config.dictConfig(UVICORN_LOG_CONFIG)
+    yield
+    logging_config.stop_logging()
+    root_logger.handlers[:] = saved_handlers
+    root_logger.setLevel(saved_level)
+
+
+class TestUvicornLogConfig:
+    """Tests for UVICORN_LOG_CONFIG."""
+
+    def test_uvicorn_loggers_propagate_to_queue(self, applied_config):
+        """Test uvicorn loggers have no direct handlers of their own."""
+        for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+            uvicorn_logger = logging.getLogger(name)
+            assert uvicorn_logger.handlers == []
+            assert uvicorn_logger.propagate
+
+        # pytest adds its own capture handlers around each test
+        queue_handlers = [
+            handler
+            for handler in logging.getLogger().handlers
+            if isinstance(handler, RecordQueueHandler)
+        ]
+        assert len(queue_handlers) == 1
+
+    def test_access_log_is_written_on_listener_thread(
+        self, applied_config, monkeypatch
+    ):
+        """Test access records are written off the calling thread."""
+        written = threading.Event()
+        writer_threads = []
+
+        def record_write(self, records):
+            writer_threads.append(threading.current_thread())
+            written.set()
+
+        monkeypatch.setattr(StdoutHandler, "write_records", record_write)
+
+        logging.getLogger("uvicorn.access").info("GET / 200")
+
+        assert written.wait(2)
+        assert writer_threads[0] is not threading.current_thread()
@@ -0,0 +1,60 @@
+"""Tests for centralized logging configuration."""
+
+import logging
+import time
+from unittest.mock import Mock
+
+from logging_config import BatchedStreamHandler
+
+
+def make_record(level: int = logging.INFO) -> logging.LogRecord:
+    """Create a log record at the given level."""
+    return logging.LogRecord("test", level, __file__, 1, "message", None, None)
+
+
+class TestBatchedStreamHandler:
+    """Tests for BatchedStreamHandler."""
+
+    def test_quiet_buffer_is_flushed_on_timer(self):
+        """Test a record below capacity is written after the interval."""
+        stream_handler = Mock()
+        handler = BatchedStreamHandler(
+            stream_handler, capacity=100, flush_interval=0.01
+        )
+        try:
+            handler.handle(make_record())
+
+            deadline = time.monotonic() + 2
+            while (
+                not stream_handler.write_records.called
+                and time.monotonic() < deadline
+            ):
+                time.sleep(0.01)
+
+            stream_handler.write_records.assert_called_once()
+            assert handler.buffer == []
+        finally:
+            handler.close()
+
+    def test_records_wait_for_interval(self):
+        """Test records stay buffered until the interval elapses."""
+        stream_handler = Mock()
+        handler = BatchedStreamHandler(
+            stream_handler, capacity=100, flush_interval=60
+        )
+        try:
+            handler.handle(make_record())
+
+            stream_handler.write_records.assert_not_called()
+        finally:
+            handler.close()
+
+        stream_handler.write_records.assert_called_once()
+
+    def test_close_stops_timer(self):
+        """Test closing the handler ends its flush thread."""
+        handler = BatchedStreamHandler(Mock(), capacity=100, flush_interval=60)
+
+        handler.close()
+
+        assert not handler._flusher.is_alive()